@@ -10,6 +10,7 @@ from fastapi import (
     Query,
     Request,
 )
+from fastapi.responses import UJSONResponse
 
 from app.api.v1.dependencies.oauth_dependencies import get_current_user
 from app.config.loggers import notification_logger as logger
@@ -26,7 +27,13 @@ from app.services.notification_service import notification_service
 router = APIRouter()
 
 
-@router.get("/notifications", response_model=PaginatedNotificationsResponse)
+# Notification pages carry many nested, already JSON-ready fields; encode them
+# with ujson instead of the stdlib encoder
+@router.get(
+    "/notifications",
+    response_model=PaginatedNotificationsResponse,
+    response_class=UJSONResponse,
+)
 async def get_notifications(
     status: Optional[NotificationStatus] = Query(None, description="Filter by status"),
     limit: int = Query(
@@ -38,6 +38,18 @@ async def init_workflow_service():
         raise
 
 
+async def init_arq_pool():
+    """Create the ARQ Redis pool so the first enqueue doesn't pay for it."""
+    try:
+        from app.utils.redis_utils import RedisPoolManager
+
+        await RedisPoolManager.get_pool()
+        logger.info("ARQ Redis pool initialized")
+    except Exception as e:
+        logger.error(f"Failed to initialize ARQ Redis pool: {e}")
+        raise
+
+
 async def init_websocket_consumer():
     """Initialize WebSocket event consumer."""
     try:
@@ -92,6 +104,17 @@ async def close_reminder_scheduler():
         logger.error(f"Error closing reminder scheduler: {e}")
 
 
+async def close_arq_pool():
+    """Close the ARQ Redis pool."""
+    try:
+        from app.utils.redis_utils import RedisPoolManager
+
+        await RedisPoolManager.close_pool()
+        logger.info("ARQ Redis pool closed")
+    except Exception as e:
+        logger.error(f"Error closing ARQ Redis pool: {e}")
+
+
 async def close_websocket_async():
     """Close WebSocket event consumer."""
     try:
@@ -169,6 +192,7 @@ async def lifespan(app: FastAPI):
             init_mongodb_async(),
             init_reminder_service(),
             init_workflow_service(),
+            init_arq_pool(),
             init_websocket_consumer(),
             init_tools_store_async(),
             providers.initialize_auto_providers(),
@@ -183,6 +207,7 @@ async def lifespan(app: FastAPI):
                 "mongodb",
                 "reminder_service",
                 "workflow_service",
+                "arq_pool",
                 "websocket_consumer",
                 "tools_store",
                 "lazy_providers_auto_initializer",
@@ -204,6 +229,7 @@ async def lifespan(app: FastAPI):
         shutdown_tasks = [
             close_postgresql_async(),
             close_reminder_scheduler(),
+            close_arq_pool(),
             close_websocket_async(),
             close_publisher_async(),
         ]
@@ -215,6 +241,7 @@ async def lifespan(app: FastAPI):
         shutdown_service_names = [
             "postgresql",
             "reminder_scheduler",
+            "arq_pool",
             "websocket",
             "publisher",
         ]
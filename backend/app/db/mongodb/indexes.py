@@ -391,12 +391,16 @@ async def create_notification_indexes():
         await asyncio.gather(
             # For user-specific notifications
             notifications_collection.create_index([("user_id", 1), ("created_at", -1)]),
-            # For unread notifications
-            notifications_collection.create_index(
-                [("user_id", 1), ("read", 1), ("created_at", -1)]
-            ),
             # For notification type filtering
             notifications_collection.create_index([("user_id", 1), ("type", 1)]),
+            # For listing notifications filtered by status
+            notifications_collection.create_index(
+                [("user_id", 1), ("status", 1), ("created_at", -1)]
+            ),
+            # For listing notifications filtered by channel type
+            notifications_collection.create_index(
+                [("user_id", 1), ("channels.channel_type", 1), ("created_at", -1)]
+            ),
         )
 
         logger.info("Created notification indexes")
@@ -120,6 +120,35 @@ async def set_cache(key: str, value: Any, ttl: int = ONE_YEAR_TTL):
     await redis_cache.set(key, value, ttl)
 
 
+async def get_cache_raw(key: str) -> str | None:
+    """
+    Get a cached string by key without JSON decoding.
+    """
+    if not redis_cache.redis:
+        logger.warning("Redis is not initialized. Skipping get operation.")
+        return None
+
+    try:
+        return await redis_cache.redis.get(name=key)
+    except Exception as e:
+        logger.error(f"Error accessing Redis for key {key}: {e}")
+        return None
+
+
+async def set_cache_raw(key: str, value: str, ttl: int = ONE_YEAR_TTL):
+    """
+    Set an already serialized string with an optional TTL.
+    """
+    if not redis_cache.redis:
+        logger.warning("Redis is not initialized. Skipping set operation.")
+        return
+
+    try:
+        await redis_cache.redis.setex(key, ttl or redis_cache.default_ttl, value)
+    except Exception as e:
+        logger.error(f"Error setting Redis key {key}: {e}")
+
+
 async def delete_cache(key: str):
     """
     Delete a cached key.
@@ -140,7 +140,9 @@ async def execute_graph_silent(
         - tool_data: Dictionary of extracted tool execution data and results
         - token_metadata: Dictionary containing token usage information
     """
-    complete_message = ""
+    # Collect the streamed chunks and join them when needed, instead of
+    # re-copying the whole message on every chunk
+    message_chunks: list[str] = []
     tool_data = {}
 
     # Get storage context from config
@@ -164,7 +166,7 @@ async def execute_graph_silent(
             if chunk and isinstance(chunk, AIMessageChunk):
                 content = str(chunk.content)
                 if content:
-                    complete_message += content
+                    message_chunks.append(content)
 
         elif stream_mode == "custom":
             new_data = process_custom_event_for_tools(payload)
@@ -174,9 +176,11 @@ async def execute_graph_silent(
                 # Store progress immediately when tool completes (same pattern as chat)
                 if conversation_id and user_id:
                     await store_agent_progress(
-                        conversation_id, user_id, complete_message, tool_data
+                        conversation_id, user_id, "".join(message_chunks), tool_data
                     )
 
+    complete_message = "".join(message_chunks)
+
     # Get token usage metadata from callback
     token_metadata = usage_metadata_callback.usage_metadata
 
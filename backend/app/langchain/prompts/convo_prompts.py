@@ -1,4 +1,4 @@
-CONVERSATION_DESCRIPTION_GENERATOR = """
+CONVERSATION_DESCRIPTION_SYSTEM_PROMPT = """
 Summarize the user's latest chat request in 3 to 5 words. Be ultra-concise, capturing only the core intent. No punctuation or filler. Output only the phrase. Do not include any additional text, explanation, formatting, or double quotes.
 
 Incorporate context from the selected tool or workflow if present. Reflect the nature of the tool's purpose (e.g., code execution, web search, image generation) or workflow execution in the summary when relevant.
@@ -8,7 +8,9 @@ Can you help me write a cold email to pitch my product to investors?
 
 Expected Output:
 Investor pitch email
+"""
 
+CONVERSATION_DESCRIPTION_GENERATOR = """
 User Message: {user_message}
 Selected Tool (if any): {selectedTool}
 Workflow Context (if any): {workflow_context}
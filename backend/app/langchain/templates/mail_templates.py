@@ -8,6 +8,7 @@ import email.policy
 from html import unescape
 from typing import Any, Dict, List, Optional
 
+from app.config.loggers import app_logger as logger
 from app.langchain.prompts.mail_prompts import (
     COMPOSE_EMAIL_SUMMARY,
     EMAIL_PROCESSING_PLANNER,
@@ -51,7 +52,7 @@ class GmailMessageParser:
             return self.email_message is not None
 
         except Exception as e:
-            print(f"GmailMessageParser failed: {e}")
+            logger.debug(f"GmailMessageParser failed: {e}")
             self._parsed = False
             return False
 
@@ -187,6 +187,9 @@ class NotificationRecord(BaseModel):
     archived_at: Optional[datetime] = None
     channels: List[ChannelDeliveryStatus] = Field(default_factory=list)
     original_request: NotificationRequest
+    # API representation of original_request.content, computed once at
+    # creation and refreshed when an action is executed
+    serialized_content: Optional[Dict[str, Any]] = None
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     def mark_as_read(self) -> None:
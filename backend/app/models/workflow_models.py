@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 
 from app.config.loggers import general_logger as logger
 from app.models.scheduler_models import BaseScheduledTask
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 
 
 class TriggerType(str, Enum):
@@ -170,9 +170,12 @@ class TriggerConfig(BaseModel):
 class Workflow(BaseScheduledTask):
     """Main workflow model extending BaseScheduledTask for scheduling capabilities."""
 
-    # Override ID generation for workflows - always generate ID
+    # Override ID generation for workflows - always generate ID.
+    # Read from "_id" so Mongo documents validate without renaming the key,
+    # while responses keep serializing it as "id"
     id: Optional[str] = Field(
         default_factory=lambda: f"wf_{uuid.uuid4().hex[:12]}",
+        validation_alias=AliasChoices("_id", "id"),
         description="Unique identifier",
     )
 
@@ -4,7 +4,10 @@ from typing import Any, Dict, List, Optional
 
 from app.config.loggers import general_logger as logger
 from app.services.composio_service import composio_service
-from app.utils.general_utils import transform_gmail_message
+from app.utils.general_utils import (
+    transform_gmail_message,
+    transform_gmail_messages,
+)
 from fastapi import UploadFile
 
 
@@ -437,9 +440,7 @@ async def fetch_thread(user_id: str, thread_id: str) -> Dict[str, Any]:
 
             # Transform messages in the thread for easier frontend processing
             if "messages" in thread:
-                thread["messages"] = [
-                    transform_gmail_message(msg) for msg in thread["messages"]
-                ]
+                thread["messages"] = transform_gmail_messages(thread["messages"])
 
                 # Sort messages by date (oldest first)
                 thread["messages"].sort(key=lambda msg: int(msg.get("internalDate", 0)))
@@ -489,7 +490,7 @@ async def search_messages(
             # Transform messages if needed
             messages = result.get("messages", [])
             return {
-                "messages": [transform_gmail_message(msg) for msg in messages],
+                "messages": transform_gmail_messages(messages),
                 "nextPageToken": result.get("nextPageToken"),
             }
         else:
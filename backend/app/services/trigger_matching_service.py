@@ -28,12 +28,8 @@ async def find_matching_workflows(user_id: str) -> List[Workflow]:
 
         async for workflow_doc in cursor:
             try:
-                workflow_doc["id"] = workflow_doc.get("_id")
-                if "_id" in workflow_doc:
-                    del workflow_doc["_id"]
-
-                workflow = Workflow(**workflow_doc)
-                workflows.append(workflow)
+                # Workflow reads its id from "_id", so no renaming is needed
+                workflows.append(Workflow(**workflow_doc))
 
             except Exception as e:
                 logger.error(f"Error processing workflow document: {e}")
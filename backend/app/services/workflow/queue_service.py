@@ -1,14 +1,33 @@
 """Workflow queue service for background job management."""
 
-from typing import Optional
+import asyncio
+from typing import Coroutine, Optional
 
 from app.config.loggers import general_logger as logger
 from app.utils.redis_utils import RedisPoolManager
 
+# Strong references to in-flight enqueue tasks so they are not garbage collected
+_pending_tasks: set[asyncio.Task] = set()
+
+
+def _on_enqueue_done(task: asyncio.Task) -> None:
+    """Release a finished enqueue task and log anything it raised."""
+    _pending_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background workflow enqueue failed: {task.exception()}")
+
 
 class WorkflowQueueService:
     """Service for managing workflow job queues."""
 
+    @staticmethod
+    def dispatch(coro: Coroutine) -> asyncio.Task:
+        """Run an enqueue coroutine in the background without awaiting Redis."""
+        task = asyncio.create_task(coro)
+        _pending_tasks.add(task)
+        task.add_done_callback(_on_enqueue_done)
+        return task
+
     @staticmethod
     async def queue_workflow_generation(workflow_id: str, user_id: str) -> None:
         """Queue workflow generation as a background task."""
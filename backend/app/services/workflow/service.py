@@ -3,8 +3,7 @@ Clean workflow service for GAIA workflow system.
 Handles CRUD operations and execution coordination.
 """
 
-import uuid
-from datetime import datetime, timezone
+import asyncio
 from typing import List, Optional
 
 from app.config.loggers import general_logger as logger
@@ -20,11 +19,13 @@ from app.models.workflow_models import (
 from .generation_service import WorkflowGenerationService
 from .queue_service import WorkflowQueueService
 from .scheduler_service import workflow_scheduler_service
+from pymongo import ReturnDocument
 from app.utils.workflow_utils import (
     ensure_trigger_config_object,
     handle_workflow_error,
     transform_workflow_document,
 )
+from uuid_extensions import uuid7str
 from .validators import WorkflowValidator
 
 
@@ -65,7 +66,7 @@ class WorkflowService:
 
             # Insert into database
             workflow_dict = workflow.model_dump()
-            workflow_dict["_id"] = workflow_dict["id"]
+            workflow_dict["_id"] = workflow.id
 
             result = await workflows_collection.insert_one(workflow_dict)
             if not result.inserted_id:
@@ -76,31 +77,44 @@ class WorkflowService:
             if not workflow.id:
                 raise ValueError("Workflow ID is required")
 
+            # Scheduling and step generation only depend on the inserted
+            # document, so run them concurrently
+            post_insert_tasks = []
+
             # Schedule the workflow if it's a scheduled type and enabled
             if (
                 trigger_config.type == "schedule"
                 and trigger_config.enabled
                 and trigger_config.next_run
             ):
-                await workflow_scheduler_service.schedule_workflow_execution(
-                    workflow.id,
-                    user_id,
-                    trigger_config.next_run,
-                    repeat=trigger_config.cron_expression,  # Enable recurring if cron exists
+                post_insert_tasks.append(
+                    workflow_scheduler_service.schedule_workflow_execution(
+                        workflow.id,
+                        user_id,
+                        trigger_config.next_run,
+                        repeat=trigger_config.cron_expression,  # Enable recurring if cron exists
+                    )
                 )
 
             # Generate steps
             if request.generate_immediately:
-                await WorkflowService._generate_workflow_steps(workflow.id, user_id)
+                post_insert_tasks.append(
+                    WorkflowService._generate_workflow_steps(workflow.id, user_id)
+                )
+            else:
+                # Enqueueing is fire-and-forget; failures are only logged
+                WorkflowQueueService.dispatch(
+                    WorkflowQueueService.queue_workflow_generation(workflow.id, user_id)
+                )
+
+            await asyncio.gather(*post_insert_tasks)
+
+            if request.generate_immediately:
                 # Fetch the updated workflow with generated steps
                 updated_workflow = await WorkflowService.get_workflow(
                     workflow.id, user_id
                 )
                 return updated_workflow or workflow
-            else:
-                await WorkflowQueueService.queue_workflow_generation(
-                    workflow.id, user_id
-                )
 
             return workflow
 
@@ -132,9 +146,11 @@ class WorkflowService:
         """List all workflows for a user."""
         try:
             # Use to_list() for better performance
+            # Pin the (user_id, created_at) index so the sort never happens in memory
             docs = (
                 await workflows_collection.find({"user_id": user_id})
                 .sort("created_at", -1)
+                .hint([("user_id", 1), ("created_at", -1)])
                 .to_list(length=None)
             )
 
@@ -170,7 +186,6 @@ class WorkflowService:
             if not current_workflow:
                 return None
 
-            update_data = {"updated_at": datetime.now(timezone.utc)}
             update_fields = request.model_dump(exclude_unset=True)
 
             # Handle trigger config changes
@@ -228,17 +243,21 @@ class WorkflowService:
                 # Convert TriggerConfig back to dict for MongoDB storage
                 update_fields["trigger_config"] = new_trigger_config.model_dump()
 
-            update_data.update(update_fields)
+            update: dict = {"$currentDate": {"updated_at": True}}
+            if update_fields:
+                update["$set"] = update_fields
 
-            result = await workflows_collection.update_one(
-                {"_id": workflow_id, "user_id": user_id}, {"$set": update_data}
+            updated_doc = await workflows_collection.find_one_and_update(
+                {"_id": workflow_id, "user_id": user_id},
+                update,
+                return_document=ReturnDocument.AFTER,
             )
 
-            if result.matched_count == 0:
+            if not updated_doc:
                 return None
 
             logger.info(f"Updated workflow {workflow_id} for user {user_id}")
-            return await WorkflowService.get_workflow(workflow_id, user_id)
+            return Workflow(**transform_workflow_document(updated_doc))
 
         except Exception as e:
             logger.error(f"Error updating workflow {workflow_id}: {str(e)}")
@@ -293,16 +312,18 @@ class WorkflowService:
             # Update last execution timestamp
             result = await workflows_collection.find_one_and_update(
                 {"_id": workflow_id, "user_id": user_id},
-                {"$set": {"updated_at": datetime.now(timezone.utc)}},
+                {"$currentDate": {"updated_at": True}},
             )
 
             if not result:
                 raise ValueError(f"Failed to update workflow {workflow_id}")
 
-            execution_id = f"exec_{workflow_id}_{uuid.uuid4().hex[:8]}"
+            execution_id = f"exec_{uuid7str()}"
 
-            await WorkflowQueueService.queue_workflow_execution(
-                workflow_id, user_id, request.context
+            WorkflowQueueService.dispatch(
+                WorkflowQueueService.queue_workflow_execution(
+                    workflow_id, user_id, request.context
+                )
             )
 
             logger.info(f"Started execution {execution_id} for workflow {workflow_id}")
@@ -361,11 +382,11 @@ class WorkflowService:
             update_data = {
                 "activated": True,
                 "trigger_config.enabled": True,
-                "updated_at": datetime.now(timezone.utc),
             }
 
             result = await workflows_collection.update_one(
-                {"_id": workflow_id, "user_id": user_id}, {"$set": update_data}
+                {"_id": workflow_id, "user_id": user_id},
+                {"$set": update_data, "$currentDate": {"updated_at": True}},
             )
 
             if result.matched_count == 0:
@@ -417,11 +438,11 @@ class WorkflowService:
             update_data = {
                 "activated": False,
                 "trigger_config.enabled": False,
-                "updated_at": datetime.now(timezone.utc),
             }
 
             result = await workflows_collection.update_one(
-                {"_id": workflow_id, "user_id": user_id}, {"$set": update_data}
+                {"_id": workflow_id, "user_id": user_id},
+                {"$set": update_data, "$currentDate": {"updated_at": True}},
             )
 
             if result.matched_count == 0:
@@ -457,10 +478,8 @@ class WorkflowService:
             result = await workflows_collection.find_one_and_update(
                 {"_id": workflow_id, "user_id": user_id},
                 {
-                    "$set": {
-                        "steps": steps_data,
-                        "updated_at": datetime.now(timezone.utc),
-                    }
+                    "$set": {"steps": steps_data},
+                    "$currentDate": {"updated_at": True},
                 },
                 return_document=True,
             )
@@ -480,7 +499,7 @@ class WorkflowService:
         try:
             await workflows_collection.find_one_and_update(
                 {"_id": workflow_id, "user_id": user_id},
-                {"$set": {"updated_at": datetime.now(timezone.utc)}},
+                {"$currentDate": {"updated_at": True}},
             )
 
             workflow = await WorkflowService.get_workflow(workflow_id, user_id)
@@ -496,10 +515,8 @@ class WorkflowService:
                 await workflows_collection.find_one_and_update(
                     {"_id": workflow_id, "user_id": user_id},
                     {
-                        "$set": {
-                            "steps": steps_data,
-                            "updated_at": datetime.now(timezone.utc),
-                        }
+                        "$set": {"steps": steps_data},
+                        "$currentDate": {"updated_at": True},
                     },
                 )
             else:
@@ -2,10 +2,14 @@
 Simple calendar caching utilities for improved performance.
 """
 
+import base64
+import hashlib
+import json
 from typing import Any, Dict, Optional
 
+import ujson
 from app.config.loggers import calendar_logger as logger
-from app.db.redis import get_cache, set_cache, delete_cache_by_pattern
+from app.db.redis import delete_cache_by_pattern, get_cache_raw, set_cache_raw
 
 
 class CalendarCache:
@@ -14,12 +18,23 @@ class CalendarCache:
     def __init__(self, default_ttl: int = 300):  # 5 minutes default
         self.default_ttl = default_ttl
 
-    def _make_key(self, key_type: str, user_id: str, **kwargs) -> str:
-        """Generate cache key with consistent format."""
+    def _make_key(
+        self, key_type: str, user_id: str, scope: Optional[str] = None, **kwargs
+    ) -> str:
+        """
+        Generate cache key with consistent format.
+
+        Keyword parameters are hashed into a short digest instead of being
+        spelled out, which keeps keys compact. The optional scope is kept in
+        plain text so pattern based invalidation can still target it.
+        """
         base_key = f"calendar:{key_type}:{user_id}"
+        if scope:
+            base_key = f"{base_key}:{scope}"
         if kwargs:
-            suffix = ":".join([f"{k}={v}" for k, v in sorted(kwargs.items())])
-            return f"{base_key}:{suffix}"
+            payload = json.dumps(sorted(kwargs.items()), separators=(",", ":"))
+            digest = hashlib.blake2b(payload.encode(), digest_size=12).digest()
+            return f"{base_key}:{base64.urlsafe_b64encode(digest).decode()}"
         return base_key
 
     async def get_events(
@@ -34,15 +49,15 @@ class CalendarCache:
             key = self._make_key(
                 "events",
                 user_id,
-                calendar_id=calendar_id,
+                scope=calendar_id,
                 time_min=time_min or "",
                 time_max=time_max or "",
             )
 
-            cached_data = await get_cache(key)
+            cached_data = await get_cache_raw(key)
             if cached_data:
                 logger.info(f"Cache hit for events: {key}")
-                return cached_data
+                return ujson.loads(cached_data)
 
             logger.debug(f"Cache miss for events: {key}")
             return None
@@ -65,13 +80,13 @@ class CalendarCache:
             key = self._make_key(
                 "events",
                 user_id,
-                calendar_id=calendar_id,
+                scope=calendar_id,
                 time_min=time_min or "",
                 time_max=time_max or "",
             )
 
             cache_ttl = ttl or self.default_ttl
-            await set_cache(key, events_data, cache_ttl)
+            await set_cache_raw(key, ujson.dumps(events_data), cache_ttl)
 
             logger.info(f"Cached events for {cache_ttl}s: {key}")
 
@@ -82,11 +97,11 @@ class CalendarCache:
         """Get cached calendar list."""
         try:
             key = self._make_key("calendars", user_id)
-            cached_data = await get_cache(key)
+            cached_data = await get_cache_raw(key)
 
             if cached_data:
                 logger.info(f"Cache hit for calendars: {key}")
-                return cached_data
+                return ujson.loads(cached_data)
 
             logger.debug(f"Cache miss for calendars: {key}")
             return None
@@ -103,7 +118,7 @@ class CalendarCache:
             key = self._make_key("calendars", user_id)
             cache_ttl = ttl or (self.default_ttl * 12)  # Longer TTL for calendar list
 
-            await set_cache(key, calendars_data, cache_ttl)
+            await set_cache_raw(key, ujson.dumps(calendars_data), cache_ttl)
             logger.info(f"Cached calendars for {cache_ttl}s: {key}")
 
         except Exception as e:
@@ -125,7 +140,7 @@ class CalendarCache:
         """Invalidate events cache for user/calendar."""
         try:
             if calendar_id:
-                pattern = f"calendar:events:{user_id}:calendar_id={calendar_id}*"
+                pattern = f"calendar:events:{user_id}:{calendar_id}:*"
             else:
                 pattern = f"calendar:events:{user_id}*"
 
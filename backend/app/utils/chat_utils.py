@@ -3,7 +3,11 @@ from typing import List, Optional
 from app.config.loggers import chat_logger as logger
 from app.langchain.core.state import State
 from app.langchain.llm.chatbot import chatbot
-from app.langchain.prompts.convo_prompts import CONVERSATION_DESCRIPTION_GENERATOR
+from app.langchain.llm.client import init_llm
+from app.langchain.prompts.convo_prompts import (
+    CONVERSATION_DESCRIPTION_GENERATOR,
+    CONVERSATION_DESCRIPTION_SYSTEM_PROMPT,
+)
 from app.models.message_models import MessageDict, SelectedWorkflowData
 
 # from uuid_extensions import uuid7, uuid7str
@@ -11,12 +15,16 @@ from app.services.conversation_service import (
     ConversationModel,
     create_conversation_service,
 )
-from fastapi import HTTPException
 from langchain_core.messages import AnyMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 from langsmith import traceable
 from uuid_extensions import uuid7str
 
+# The title instructions never change, so build their message once
+_CONVERSATION_DESCRIPTION_SYSTEM_MESSAGE = SystemMessage(
+    content=CONVERSATION_DESCRIPTION_SYSTEM_PROMPT
+)
+
 
 @traceable(name="Create Conversation")
 async def create_conversation(
@@ -39,20 +47,14 @@ async def create_conversation(
     if selectedWorkflow:
         workflow_context = f" - Workflow: {selectedWorkflow.title}"
 
-    response = await do_prompt_no_stream(
-        prompt=CONVERSATION_DESCRIPTION_GENERATOR.format(
+    description = await generate_conversation_description(
+        CONVERSATION_DESCRIPTION_GENERATOR.format(
             user_message=user_message,
             selectedTool=selectedTool,
             workflow_context=workflow_context,
-        ),
+        )
     )
 
-    # Validate LLM response
-    if not isinstance(response, dict) or "response" not in response:
-        raise HTTPException(status_code=500, detail="Invalid response from LLM")
-
-    description = response.get("response", "New Chat").replace('"', "").strip()
-
     conversation = ConversationModel(
         conversation_id=str(uuid_value), description=description
     )
@@ -65,6 +67,33 @@ async def create_conversation(
     }
 
 
+async def generate_conversation_description(prompt: str) -> str:
+    """
+    Generate a short conversation title straight from the LLM.
+
+    Skips building a graph State and going through the chatbot node, since
+    a title only needs a single model call.
+    """
+    try:
+        llm = init_llm()
+        ai_message = await llm.ainvoke(
+            [_CONVERSATION_DESCRIPTION_SYSTEM_MESSAGE, HumanMessage(content=prompt)]
+        )
+    except Exception as e:
+        logger.error(f"Error generating conversation description: {str(e)}")
+        return "New Chat"
+
+    # A title is not worth failing the conversation over, so an unexpected
+    # response shape falls back to the default title as well
+    if not isinstance(ai_message.content, str):
+        logger.warning(
+            f"Unexpected conversation description content type: {type(ai_message.content).__name__}"
+        )
+        return "New Chat"
+
+    return ai_message.content.replace('"', "").strip() or "New Chat"
+
+
 async def do_prompt_no_stream(
     prompt: str,
     system_prompt: str | None = None,
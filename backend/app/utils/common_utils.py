@@ -43,6 +43,17 @@ class WebSocketManager:
                 del self.connections[user_id]
         logger.info(f"Removed WebSocket connection for user {user_id}")
 
+    def has_connections(self, user_id: str) -> bool:
+        """
+        Check if a broadcast to the user could reach any connection.
+
+        Outside the main app connections live in another process and messages
+        are relayed through RabbitMQ, so this is always True there.
+        """
+        if not is_main_app():
+            return True
+        return bool(self.connections.get(user_id))
+
     async def broadcast_to_user(self, user_id: str, message: Dict[str, Any]) -> None:
         """Broadcast message to all connections for a user"""
 
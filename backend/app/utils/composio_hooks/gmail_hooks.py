@@ -24,11 +24,22 @@ from .registry import register_after_hook, register_before_hook
 # These hooks send progress/streaming data to frontend before tool execution
 
 
+# Streaming payload key sent to the frontend for each compose tool
+_COMPOSE_PAYLOAD_KEYS = {
+    "GMAIL_CREATE_EMAIL_DRAFT": "email_compose_data",
+    "GMAIL_SEND_EMAIL": "email_sent_data",
+}
+
+
 @register_before_hook(tools=["GMAIL_SEND_EMAIL", "GMAIL_CREATE_EMAIL_DRAFT"])
 def gmail_compose_before_hook(
     tool: str, toolkit: str, params: ToolExecuteParams
 ) -> ToolExecuteParams:
     """Handle email composition response and streaming data."""
+    payload_key = _COMPOSE_PAYLOAD_KEYS.get(tool)
+    if payload_key is None:
+        return params
+
     try:
         writer = get_stream_writer()
         arguments = params.get("arguments", {})
@@ -50,18 +61,9 @@ def gmail_compose_before_hook(
                 "is_html": arguments.get("is_html", False),
             }
         ]
-        # Check if the operation was successful
-        if tool == "GMAIL_CREATE_EMAIL_DRAFT":
-            # Send compose data to frontend with draft_id
-            payload = {
-                "email_compose_data": emails_data,
-            }
-            writer(payload)
 
-        elif tool == "GMAIL_SEND_EMAIL":
-            # Send email sent data to frontend
-            payload = {"email_sent_data": emails_data}
-            writer(payload)
+        # Send compose (draft) or sent data to frontend
+        writer({payload_key: emails_data})
 
         return params
 
@@ -101,12 +103,13 @@ def gmail_fetch_after_hook(
 ) -> Any:
     """Process email fetch response and send data to frontend."""
     try:
-        writer = get_stream_writer()
-
         # Process the raw response to minimize data for LLM
         processed_response = process_list_messages_response(response["data"])
 
-        if writer and processed_response.get("messages"):
+        # The stream writer belongs to the current graph run, so it is looked
+        # up per call, but only once there is something to stream
+        writer = get_stream_writer() if processed_response.get("messages") else None
+        if writer:
             # Transform to EmailFetchData format for frontend
             email_fetch_data = []
             for msg in processed_response["messages"]:
@@ -159,15 +162,14 @@ def gmail_thread_after_hook(
 ) -> Any:
     """Process thread response and send data to frontend."""
     try:
-        writer = get_stream_writer()
-
         if not response or "error" in response["data"]:
             return response["data"]
 
         # Process the raw thread response
         processed_response = process_get_thread_response(response["data"])
 
-        if writer and processed_response.get("messages"):
+        writer = get_stream_writer() if processed_response.get("messages") else None
+        if writer:
             # Transform to EmailThreadData format for frontend
             thread_messages = []
             for msg in processed_response["messages"]:
@@ -450,9 +452,10 @@ def gmail_send_draft_after_hook(
 ) -> Any:
     """Process draft sending response."""
     try:
-        writer = get_stream_writer()
-
-        if writer and response["data"].get("successful", True):
+        writer = (
+            get_stream_writer() if response["data"].get("successful", True) else None
+        )
+        if writer:
             # Send email sent data to frontend
             message_data = response["data"].get("message", {})
 
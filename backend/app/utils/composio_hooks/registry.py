@@ -5,7 +5,7 @@ This module provides the central registry and master execution hooks that handle
 ALL Composio tools with built-in user_id extraction and frontend streaming.
 """
 
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from app.config.loggers import app_logger as logger
 from composio.types import ToolExecuteParams
@@ -20,32 +20,71 @@ class ComposioHookRegistry:
     """
 
     def __init__(self):
-        # Registry for before_execute hooks
+        # Registry for before_execute hooks, with the tools/toolkits they target
         self._before_hooks: List[
-            Callable[[str, str, ToolExecuteParams], ToolExecuteParams]
+            Tuple[
+                Callable[[str, str, ToolExecuteParams], ToolExecuteParams],
+                FrozenSet[str],
+                FrozenSet[str],
+            ]
         ] = []
 
-        # Registry for after_execute hooks
-        self._after_hooks: List[Callable[[str, str, Any], Any]] = []
+        # Registry for after_execute hooks, with the tools/toolkits they target
+        self._after_hooks: List[
+            Tuple[Callable[[str, str, Any], Any], FrozenSet[str], FrozenSet[str]]
+        ] = []
+
+        # Hooks that apply to each (tool, toolkit) pair, in registration order.
+        # Resolved on first use so tools without hooks skip straight through
+        self._before_chains: Dict[Tuple[str, str], List[Callable]] = {}
+        self._after_chains: Dict[Tuple[str, str], List[Callable]] = {}
 
     def register_before_hook(
-        self, hook_func: Callable[[str, str, ToolExecuteParams], ToolExecuteParams]
+        self,
+        hook_func: Callable[[str, str, ToolExecuteParams], ToolExecuteParams],
+        tools: FrozenSet[str] = frozenset(),
+        toolkits: FrozenSet[str] = frozenset(),
     ) -> None:
         """Register a before_execute hook function."""
-        self._before_hooks.append(hook_func)
+        self._before_hooks.append((hook_func, tools, toolkits))
+        self._before_chains.clear()
         logger.debug(f"Registered before_execute hook: {hook_func.__name__}")
 
-    def register_after_hook(self, hook_func: Callable[[str, str, Any], Any]) -> None:
+    def register_after_hook(
+        self,
+        hook_func: Callable[[str, str, Any], Any],
+        tools: FrozenSet[str] = frozenset(),
+        toolkits: FrozenSet[str] = frozenset(),
+    ) -> None:
         """Register an after_execute hook function."""
-        self._after_hooks.append(hook_func)
+        self._after_hooks.append((hook_func, tools, toolkits))
+        self._after_chains.clear()
         logger.debug(f"Registered after_execute hook: {hook_func.__name__}")
 
+    @staticmethod
+    def _resolve_chain(
+        hooks: List[Tuple[Callable, FrozenSet[str], FrozenSet[str]]],
+        tool: str,
+        toolkit: str,
+    ) -> List[Callable]:
+        """Select the hooks targeting a tool/toolkit; untargeted hooks run for all."""
+        return [
+            hook_func
+            for hook_func, tools, toolkits in hooks
+            if (not tools and not toolkits) or tool in tools or toolkit in toolkits
+        ]
+
     def execute_before_hooks(
         self, tool: str, toolkit: str, params: ToolExecuteParams
     ) -> ToolExecuteParams:
         """Execute all registered before_execute hooks."""
+        chain = self._before_chains.get((tool, toolkit))
+        if chain is None:
+            chain = self._resolve_chain(self._before_hooks, tool, toolkit)
+            self._before_chains[(tool, toolkit)] = chain
+
         modified_params = params
-        for hook_func in self._before_hooks:
+        for hook_func in chain:
             try:
                 modified_params = hook_func(tool, toolkit, modified_params)
             except Exception as e:
@@ -57,8 +96,13 @@ class ComposioHookRegistry:
 
     def execute_after_hooks(self, tool: str, toolkit: str, response: Any) -> Any:
         """Execute all registered after_execute hooks."""
+        chain = self._after_chains.get((tool, toolkit))
+        if chain is None:
+            chain = self._resolve_chain(self._after_hooks, tool, toolkit)
+            self._after_chains[(tool, toolkit)] = chain
+
         modified_response = response
-        for hook_func in self._after_hooks:
+        for hook_func in chain:
             try:
                 modified_response = hook_func(tool, toolkit, modified_response)
             except Exception as e:
@@ -73,6 +117,13 @@ class ComposioHookRegistry:
 hook_registry = ComposioHookRegistry()
 
 
+def _as_name_set(names: Optional[Union[str, List[str]]]) -> FrozenSet[str]:
+    """Normalize a tool or toolkit name filter to a frozenset."""
+    if not names:
+        return frozenset()
+    return frozenset([names] if isinstance(names, str) else names)
+
+
 def master_before_execute_hook(
     tool: str, toolkit: str, params: ToolExecuteParams
 ) -> ToolExecuteParams:
@@ -141,37 +192,11 @@ def register_before_hook(
     """
 
     def decorator(func: Callable[[str, str, ToolExecuteParams], ToolExecuteParams]):
-        # Normalize tools and toolkits to lists
-        target_tools = []
-        if tools:
-            target_tools = [tools] if isinstance(tools, str) else tools
-
-        target_toolkits = []
-        if toolkits:
-            target_toolkits = [toolkits] if isinstance(toolkits, str) else toolkits
-
-        def conditional_hook(
-            tool: str, toolkit: str, params: ToolExecuteParams
-        ) -> ToolExecuteParams:
-            # Check if this hook should run for this tool/toolkit
-            should_run = False
-
-            # If no specific tools/toolkits specified, run for all
-            if not target_tools and not target_toolkits:
-                should_run = True
-            else:
-                # Check tool match
-                if target_tools and tool in target_tools:
-                    should_run = True
-                # Check toolkit match
-                if target_toolkits and toolkit in target_toolkits:
-                    should_run = True
-
-            if should_run:
-                return func(tool, toolkit, params)
-            return params
-
-        hook_registry.register_before_hook(conditional_hook)
+        # The registry only runs the hook for matching tools/toolkits,
+        # or for all tools if none are specified
+        hook_registry.register_before_hook(
+            func, _as_name_set(tools), _as_name_set(toolkits)
+        )
         return func
 
     return decorator
@@ -205,35 +230,11 @@ def register_after_hook(
     """
 
     def decorator(func: Callable[[str, str, Any], Any]):
-        # Normalize tools and toolkits to lists
-        target_tools = []
-        if tools:
-            target_tools = [tools] if isinstance(tools, str) else tools
-
-        target_toolkits = []
-        if toolkits:
-            target_toolkits = [toolkits] if isinstance(toolkits, str) else toolkits
-
-        def conditional_hook(tool: str, toolkit: str, response: Any) -> Any:
-            # Check if this hook should run for this tool/toolkit
-            should_run = False
-
-            # If no specific tools/toolkits specified, run for all
-            if not target_tools and not target_toolkits:
-                should_run = True
-            else:
-                # Check tool match
-                if target_tools and tool in target_tools:
-                    should_run = True
-                # Check toolkit match
-                if target_toolkits and toolkit in target_toolkits:
-                    should_run = True
-
-            if should_run:
-                return func(tool, toolkit, response)
-            return response
-
-        hook_registry.register_after_hook(conditional_hook)
+        # The registry only runs the hook for matching tools/toolkits,
+        # or for all tools if none are specified
+        hook_registry.register_after_hook(
+            func, _as_name_set(tools), _as_name_set(toolkits)
+        )
         return func
 
     return decorator
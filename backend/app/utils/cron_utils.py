@@ -2,10 +2,16 @@
 Cron utilities for reminder scheduling.
 """
 
-from datetime import datetime, timezone
-from typing import Optional
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
 
-from croniter import croniter
+from croniter import croniter as zoned_croniter
+from croniter_rs import croniter
+
+_UTC = timezone.utc
 
 
 class CronError(Exception):
@@ -14,6 +20,53 @@ class CronError(Exception):
     pass
 
 
+def _as_utc(dt: datetime) -> datetime:
+    """Treat a naive datetime as UTC, returning aware datetimes unchanged."""
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=_UTC)
+
+
+def _now_utc() -> datetime:
+    """Get the current time as a UTC timezone-aware datetime."""
+    return datetime.now(_UTC)
+
+
+@lru_cache(maxsize=512)
+def _tz(name: str) -> ZoneInfo:
+    """Resolve a timezone name, keeping recently used zones around."""
+    return ZoneInfo(name)
+
+
+def _is_fixed_offset(dt: datetime) -> bool:
+    """Check whether a datetime's UTC offset can never change, e.g. UTC."""
+    return dt.tzinfo is None or isinstance(dt.tzinfo, timezone)
+
+
+def _attach_base_tz(value: datetime, base_time: datetime) -> datetime:
+    """
+    Give a croniter-rs result the fixed-offset timezone of its base time.
+
+    croniter-rs returns naive wall-clock datetimes even for timezone-aware
+    base times, so it is only used for bases without DST transitions.
+    """
+    if value.tzinfo is not None or base_time.tzinfo is None:
+        return value
+    return value.replace(tzinfo=base_time.tzinfo)
+
+
+def _make_zoned_cron(cron_expr: str, base_time: datetime) -> zoned_croniter:
+    """
+    Build a croniter iterator for a base time in a zone with DST transitions.
+
+    croniter-rs works on naive wall-clock times, which skips or repeats fire
+    times around DST transitions. The pure Python croniter resolves
+    ambiguous and nonexistent local times the way the schedules expect.
+    """
+    try:
+        return zoned_croniter(cron_expr, base_time)
+    except (ValueError, TypeError):
+        raise CronError(f"Invalid cron expression: {cron_expr}")
+
+
 def validate_cron_expression(cron_expr: str) -> bool:
     """
     Validate a cron expression.
@@ -24,6 +77,14 @@ def validate_cron_expression(cron_expr: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    if not isinstance(cron_expr, str):
+        return False
+    return _is_valid_cron(cron_expr)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_cron(cron_expr: str) -> bool:
+    """Parse a cron expression once and remember whether it is valid."""
     try:
         croniter(cron_expr)
         return True
@@ -31,6 +92,29 @@ def validate_cron_expression(cron_expr: str) -> bool:
         return False
 
 
+def _next_fire_time(cron_expr: str, base_time: datetime) -> datetime:
+    """Get the first fire time strictly after base_time, in base_time's zone."""
+    if not _is_fixed_offset(base_time):
+        return _make_zoned_cron(cron_expr, base_time).get_next(datetime)
+
+    # The closed forms work on wall-clock times, so they are only exact
+    # without DST transitions
+    fast = _FAST_CRON.get(cron_expr)
+    if fast is not None:
+        return _attach_base_tz(fast(base_time.replace(tzinfo=None)), base_time)
+
+    cron = _make_cron(cron_expr, base_time)
+    return _attach_base_tz(cron.get_next(datetime), base_time)
+
+
+def _make_cron(cron_expr: str, base_time: datetime) -> croniter:
+    """Build a croniter iterator, raising CronError for invalid expressions."""
+    try:
+        return croniter(cron_expr, base_time)
+    except (ValueError, TypeError):
+        raise CronError(f"Invalid cron expression: {cron_expr}")
+
+
 def get_next_run_time(
     cron_expr: str,
     base_time: Optional[datetime] = None,
@@ -50,51 +134,37 @@ def get_next_run_time(
     Raises:
         CronError: If cron expression is invalid
     """
-    if not validate_cron_expression(cron_expr):
-        raise CronError(f"Invalid cron expression: {cron_expr}")
-
     # Handle timezone-aware calculation
     if user_timezone and user_timezone != "UTC":
         try:
-            import pytz
-
-            tz = pytz.timezone(user_timezone)
+            tz = _tz(user_timezone)
 
             # Get base time in user's timezone
             if base_time is None:
                 base_time = datetime.now(tz)
-            elif base_time.tzinfo is None:
-                base_time = base_time.replace(tzinfo=timezone.utc).astimezone(tz)
             else:
-                base_time = base_time.astimezone(tz)
+                base_time = _as_utc(base_time).astimezone(tz)
 
             # Calculate next run in user's timezone
-            cron = croniter(cron_expr, base_time)
-            next_time = cron.get_next(datetime)
+            next_time = _next_fire_time(cron_expr, base_time)
 
             # Convert to UTC for storage
-            return next_time.astimezone(timezone.utc)
+            return next_time.astimezone(_UTC)
 
+        except CronError:
+            raise
         except Exception:
             # Fallback to UTC if timezone conversion fails
             pass
 
-    # Default UTC calculation
-    if base_time is None:
-        base_time = datetime.now(timezone.utc)
-    elif base_time.tzinfo is None:
-        # Assume UTC if no timezone info
-        base_time = base_time.replace(tzinfo=timezone.utc)
+    # Default UTC calculation, assuming UTC if no timezone info
+    base_time = _now_utc() if base_time is None else _as_utc(base_time)
 
     try:
-        cron = croniter(cron_expr, base_time)
-        next_time = cron.get_next(datetime)
-
         # Ensure we return UTC timezone-aware datetime
-        if next_time.tzinfo is None:  # type: ignore
-            next_time = next_time.replace(tzinfo=timezone.utc)  # type: ignore
-
-        return next_time  # type: ignore
+        return _as_utc(_next_fire_time(cron_expr, base_time))
+    except CronError:
+        raise
     except Exception as e:
         raise CronError(f"Failed to calculate next run time: {str(e)}")
 
@@ -115,22 +185,17 @@ def get_previous_run_time(
     Raises:
         CronError: If cron expression is invalid
     """
-    if not validate_cron_expression(cron_expr):
-        raise CronError(f"Invalid cron expression: {cron_expr}")
-
-    if base_time is None:
-        base_time = datetime.now(timezone.utc)
-    elif base_time.tzinfo is None:
-        base_time = base_time.replace(tzinfo=timezone.utc)
+    base_time = _now_utc() if base_time is None else _as_utc(base_time)
 
     try:
-        cron = croniter(cron_expr, base_time)
-        prev_time = cron.get_prev(datetime)
-
-        if prev_time.tzinfo is None:
-            prev_time = prev_time.replace(tzinfo=timezone.utc)
-
-        return prev_time
+        if not _is_fixed_offset(base_time):
+            prev_time = _make_zoned_cron(cron_expr, base_time).get_prev(datetime)
+            return prev_time.astimezone(_UTC)
+
+        cron = _make_cron(cron_expr, base_time)
+        return _as_utc(_attach_base_tz(cron.get_prev(datetime), base_time))
+    except CronError:
+        raise
     except Exception as e:
         raise CronError(f"Failed to calculate previous run time: {str(e)}")
 
@@ -152,28 +217,34 @@ def calculate_next_occurrences(
     Raises:
         CronError: If cron expression is invalid
     """
-    if not validate_cron_expression(cron_expr):
-        raise CronError(f"Invalid cron expression: {cron_expr}")
-
     if count <= 0:
         return []
 
-    if base_time is None:
-        base_time = datetime.now(timezone.utc)
-    elif base_time.tzinfo is None:
-        base_time = base_time.replace(tzinfo=timezone.utc)
+    base_time = _now_utc() if base_time is None else _as_utc(base_time)
 
     try:
-        cron = croniter(cron_expr, base_time)
-        occurrences = []
-
-        for _ in range(count):
-            next_time = cron.get_next(datetime)
-            if next_time.tzinfo is None:  # type: ignore
-                next_time = next_time.replace(tzinfo=timezone.utc)  # type: ignore
-            occurrences.append(next_time)
-
-        return occurrences
+        if not _is_fixed_offset(base_time):
+            zoned_cron = _make_zoned_cron(cron_expr, base_time)
+            return [zoned_cron.get_next(datetime) for _ in range(count)]
+
+        fast = _FAST_CRON.get(cron_expr)
+        if fast is not None:
+            occurrences = []
+            current = base_time.replace(tzinfo=None)
+            for _ in range(count):
+                current = fast(current)
+                occurrences.append(_attach_base_tz(current, base_time))
+            return occurrences
+
+        # Let croniter-rs compute the whole batch in one call. base_time is
+        # timezone-aware here, so every result gets its timezone attached
+        cron = _make_cron(cron_expr, base_time)
+        return [
+            _attach_base_tz(next_time, base_time)
+            for next_time in cron.get_next_n(count, datetime)
+        ]
+    except CronError:
+        raise
     except Exception as e:
         raise CronError(f"Failed to calculate next occurrences: {str(e)}")
 
@@ -192,15 +263,27 @@ def is_time_in_future(
         True if target_time is in the future
     """
     if reference_time is None:
-        reference_time = datetime.now(timezone.utc)
+        reference_time = _now_utc()
 
     # Ensure both times are timezone-aware
-    if target_time.tzinfo is None:
-        target_time = target_time.replace(tzinfo=timezone.utc)
-    if reference_time.tzinfo is None:
-        reference_time = reference_time.replace(tzinfo=timezone.utc)
+    return _as_utc(target_time) > _as_utc(reference_time)
 
-    return target_time > reference_time
+
+def is_epoch_in_future(target_ts: float, now_ts: Optional[float] = None) -> bool:
+    """
+    Check if a Unix timestamp is in the future.
+
+    Cheaper alternative to is_time_in_future for hot paths that already
+    work with epoch seconds, as no datetime objects are created.
+
+    Args:
+        target_ts: Unix timestamp to check
+        now_ts: Reference Unix timestamp (defaults to the current time)
+
+    Returns:
+        True if target_ts is in the future
+    """
+    return target_ts > (time.time() if now_ts is None else now_ts)
 
 
 # Common cron expressions for easy reference
@@ -217,3 +300,99 @@ COMMON_CRON_EXPRESSIONS = {
     "monthly_first_day": "0 9 1 * *",
     "yearly_jan_1st": "0 9 1 1 *",
 }
+
+# Reverse lookup from cron expression to its common name
+_CRON_TO_NAME = {expr: name for name, expr in COMMON_CRON_EXPRESSIONS.items()}
+
+
+def cron_name(cron_expr: str) -> Optional[str]:
+    """
+    Get the common name of a cron expression, e.g. "daily_8am" for "0 8 * * *".
+
+    Args:
+        cron_expr: Cron expression
+
+    Returns:
+        Name from COMMON_CRON_EXPRESSIONS, or None if it is not a common one
+    """
+    return _CRON_TO_NAME.get(cron_expr)
+
+
+# Closed-form next fire times for the common expressions above. Each function
+# takes a naive wall-clock time and returns the next naive wall-clock match
+# strictly after it, the same way croniter-rs iterates. They are only used for
+# fixed-offset base times, where wall-clock and elapsed time agree.
+
+
+def _every_n_minutes(n: int) -> Callable[[datetime], datetime]:
+    def next_fire(t: datetime) -> datetime:
+        hour_start = t.replace(minute=0, second=0, microsecond=0)
+        return hour_start + timedelta(minutes=(t.minute // n + 1) * n)
+
+    return next_fire
+
+
+def _hourly(t: datetime) -> datetime:
+    return t.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+
+def _daily_at(hour: int) -> Callable[[datetime], datetime]:
+    def next_fire(t: datetime) -> datetime:
+        candidate = t.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if candidate <= t:
+            candidate += timedelta(days=1)
+        return candidate
+
+    return next_fire
+
+
+def _weekly_at(weekday: int, hour: int) -> Callable[[datetime], datetime]:
+    def next_fire(t: datetime) -> datetime:
+        candidate = t.replace(hour=hour, minute=0, second=0, microsecond=0) + timedelta(
+            days=(weekday - t.weekday()) % 7
+        )
+        if candidate <= t:
+            candidate += timedelta(days=7)
+        return candidate
+
+    return next_fire
+
+
+def _monthly_first_at(hour: int) -> Callable[[datetime], datetime]:
+    def next_fire(t: datetime) -> datetime:
+        candidate = t.replace(day=1, hour=hour, minute=0, second=0, microsecond=0)
+        if candidate <= t:
+            if candidate.month == 12:
+                candidate = candidate.replace(year=candidate.year + 1, month=1)
+            else:
+                candidate = candidate.replace(month=candidate.month + 1)
+        return candidate
+
+    return next_fire
+
+
+def _yearly_jan_first_at(hour: int) -> Callable[[datetime], datetime]:
+    def next_fire(t: datetime) -> datetime:
+        candidate = t.replace(
+            month=1, day=1, hour=hour, minute=0, second=0, microsecond=0
+        )
+        if candidate <= t:
+            candidate = candidate.replace(year=candidate.year + 1)
+        return candidate
+
+    return next_fire
+
+
+_FAST_CRON: dict[str, Callable[[datetime], datetime]] = {
+    COMMON_CRON_EXPRESSIONS["every_minute"]: _every_n_minutes(1),
+    COMMON_CRON_EXPRESSIONS["every_5_minutes"]: _every_n_minutes(5),
+    COMMON_CRON_EXPRESSIONS["every_15_minutes"]: _every_n_minutes(15),
+    COMMON_CRON_EXPRESSIONS["every_30_minutes"]: _every_n_minutes(30),
+    COMMON_CRON_EXPRESSIONS["hourly"]: _hourly,
+    COMMON_CRON_EXPRESSIONS["daily_8am"]: _daily_at(8),
+    COMMON_CRON_EXPRESSIONS["daily_noon"]: _daily_at(12),
+    COMMON_CRON_EXPRESSIONS["daily_6pm"]: _daily_at(18),
+    COMMON_CRON_EXPRESSIONS["weekly_monday_9am"]: _weekly_at(0, 9),
+    COMMON_CRON_EXPRESSIONS["monthly_first_day"]: _monthly_first_at(9),
+    COMMON_CRON_EXPRESSIONS["yearly_jan_1st"]: _yearly_jan_first_at(9),
+}
@@ -1,13 +1,27 @@
 import base64
-from datetime import datetime
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from time import gmtime
+from typing import Dict, List, Optional
 
 import tomllib
+import ujson
+
+# Path to pyproject.toml from this file location
+_PYPROJECT_PATH = Path(__file__).parent.parent.parent / "pyproject.toml"
+
+# Gmail headers surfaced by transform_gmail_message
+_WANTED_HEADERS = frozenset({"From", "To", "Cc", "Reply-To", "Subject"})
 
 
 def get_context_window(
-    text: str, query: str, chars_before: int = 15, chars_after: int = 30
+    text: str,
+    query: str,
+    chars_before: int = 15,
+    chars_after: int = 30,
+    *,
+    text_lower: Optional[str] = None,
 ) -> str:
     """
     Get text window around the search query with specified characters before and after.
@@ -15,19 +29,30 @@ def get_context_window(
     Args:
         text (str): Full text to search in
         query (str): Search term to find
-        chars_around (int): Number of characters to include before and after match
+        chars_before (int): Number of characters to include before the match
+        chars_after (int): Number of characters to include after the match
+        text_lower (Optional[str]): Precomputed ``text.lower()``, to avoid
+            lowercasing the same text again when searching it repeatedly
 
     Returns:
         str: Context window containing the match with surrounding text
     """
-    # Find the query in text (case-insensitive)
-    query_lower = query.lower()
-    text_lower = text.lower()
-
-    # Find the start position of the query
-    start_pos = text_lower.find(query_lower)
-    if start_pos == -1:
-        return ""
+    # Find the start position of the query (case-insensitive). ASCII text
+    # (isascii() is O(1) on str) lowercases without changing offsets, and a
+    # plain find beats a case-insensitive regex scan. Otherwise let the regex
+    # engine scan the original text so match offsets stay valid
+    if text_lower is None and text.isascii():
+        text_lower = text.lower()
+
+    if text_lower is None:
+        match = re.search(re.escape(query), text, re.IGNORECASE)
+        if not match:
+            return ""
+        start_pos = match.start()
+    else:
+        start_pos = text_lower.find(query.lower())
+        if start_pos == -1:
+            return ""
 
     # Calculate window boundaries
     window_start = max(0, start_pos - chars_before)
@@ -45,17 +70,60 @@ def get_context_window(
     return context
 
 
-def transform_gmail_message(msg) -> Dict:
-    """Transform Gmail API message to frontend-friendly format while keeping all raw data for debugging."""
-    headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+def get_context_windows(
+    text: str, queries: List[str], chars_before: int = 15, chars_after: int = 30
+) -> List[str]:
+    """
+    Get a context window for each query, lowercasing ASCII text only once.
 
-    timestamp = int(msg.get("internalDate", 0)) / 1000
-    time = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+    Args:
+        text (str): Full text to search in
+        queries (List[str]): Search terms to find
+        chars_before (int): Number of characters to include before each match
+        chars_after (int): Number of characters to include after each match
+
+    Returns:
+        List[str]: Context window per query, empty where the query is not found
+    """
+    # Only ASCII text keeps its offsets when lowercased; leave other text to
+    # get_context_window's case-insensitive regex fallback
+    text_lower = text.lower() if text.isascii() else None
+    return [
+        get_context_window(
+            text, query, chars_before, chars_after, text_lower=text_lower
+        )
+        for query in queries
+    ]
 
+
+def transform_gmail_message(msg) -> Dict:
+    """Transform Gmail API message to frontend-friendly format, keeping the raw fields still in use."""
+    # Only keep the headers we expose; messages often carry dozens of others
+    headers = {}
+    for header in msg.get("payload", {}).get("headers", ()):
+        name = header["name"]
+        if name in _WANTED_HEADERS:
+            headers[name] = header["value"]
+            if len(headers) == len(_WANTED_HEADERS):
+                break
+
+    # Format the timestamp by hand; strftime goes through locale-aware C
+    # formatting, which adds up when transforming a whole inbox page
+    t = gmtime(int(msg.get("internalDate", 0)) // 1000)
+    time = (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+    )
+
+    # Pick raw fields explicitly instead of copying every key of the message.
+    # The frontend reads labelIds and payload; internalDate orders threads
     return {
-        **msg,
         "id": msg.get("id", ""),
         "threadId": msg.get("threadId", ""),
+        "labelIds": msg.get("labelIds", []),
+        "historyId": msg.get("historyId"),
+        "internalDate": msg.get("internalDate"),
+        "sizeEstimate": msg.get("sizeEstimate"),
+        "payload": msg.get("payload", {}),
         "from": headers.get("From", ""),
         "to": headers.get("To", ""),
         "cc": headers.get("Cc", ""),
@@ -69,6 +137,24 @@ def transform_gmail_message(msg) -> Dict:
     }
 
 
+def transform_gmail_messages(msgs: List[Dict]) -> List[Dict]:
+    """Transform a batch of Gmail API messages, e.g. a thread or an inbox page."""
+    transform = transform_gmail_message
+    return [transform(msg) for msg in msgs]
+
+
+def transform_gmail_message_json(msg) -> str:
+    """Transform a Gmail API message and serialize it to JSON in one step."""
+    return ujson.dumps(transform_gmail_message(msg), ensure_ascii=False)
+
+
+def _decode_body_data(body_data: str) -> str:
+    """Decode base64url encoded Gmail body data to text."""
+    return base64.urlsafe_b64decode(body_data.encode("ascii")).decode(
+        "utf-8", errors="ignore"
+    )
+
+
 def decode_message_body(msg):
     """Decode the message body from a Gmail API message."""
     payload = msg.get("payload", {})
@@ -78,39 +164,33 @@ def decode_message_body(msg):
     if not parts:
         body_data = payload.get("body", {}).get("data", "")
         if body_data:
-            return base64.urlsafe_b64decode(
-                body_data.replace("-", "+").replace("_", "/")
-            ).decode("utf-8", errors="ignore")
+            return _decode_body_data(body_data)
         return None
 
-    # For multipart messages, prioritize HTML over plain text
-    html_body = None
-    plain_body = None
+    # For multipart messages, prioritize HTML over plain text (frontend
+    # expects HTML). Plain text parts are only decoded if no HTML part exists
+    plain_data = None
 
     for part in parts:
         part_mime_type = part.get("mimeType", "")
         body_data = part.get("body", {}).get("data", "")
 
-        if body_data:
-            decoded_content = base64.urlsafe_b64decode(
-                body_data.replace("-", "+").replace("_", "/")
-            ).decode("utf-8", errors="ignore")
+        if not body_data:
+            continue
 
-            if part_mime_type == "text/html":
-                html_body = decoded_content
-            elif part_mime_type == "text/plain":
-                plain_body = decoded_content
+        if part_mime_type == "text/html":
+            return _decode_body_data(body_data)
+        if part_mime_type == "text/plain":
+            plain_data = body_data
 
-    # Return HTML if available (frontend expects HTML), otherwise plain text
-    return html_body or plain_body
+    return _decode_body_data(plain_data) if plain_data else None
 
 
+@lru_cache(maxsize=1)
 def get_project_info() -> dict:
-    """Get project info from pyproject.toml file."""
+    """Get project info from pyproject.toml file, read once per process."""
     try:
-        # Path to pyproject.toml from this file location
-        pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-        with open(pyproject_path, "rb") as f:
+        with open(_PYPROJECT_PATH, "rb") as f:
             pyproject_data = tomllib.load(f)
             project = pyproject_data.get("project", {})
             return {
@@ -1,5 +1,6 @@
 import asyncio
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 from app.config.loggers import app_logger as logger
@@ -7,6 +8,7 @@ from app.models.notification.notification_models import (
     ActionResult,
     BulkActions,
     ChannelDeliveryStatus,
+    NotificationContent,
     NotificationRecord,
     NotificationRequest,
     NotificationSourceEnum,
@@ -30,6 +32,43 @@ from app.utils.notification.storage import (
 )
 from fastapi import Request
 
+# Fields of a notification record and its actions exposed by the API
+_RECORD_FIELDS: Dict[str, Any] = {
+    "id": True,
+    "user_id": True,
+    "status": True,
+    "created_at": True,
+    "delivered_at": True,
+    "read_at": True,
+    "snoozed_until": True,
+    "channels": {
+        "__all__": {"channel_type", "status", "delivered_at", "error_message"}
+    },
+}
+_ACTION_FIELDS = {
+    "id",
+    "type",
+    "label",
+    "style",
+    "requires_confirmation",
+    "confirmation_message",
+    "config",
+    "executed",
+    "executed_at",
+    "disabled",
+}
+
+
+# Record attributes merged into the dumped fields, fetched in a single call
+_RECORD_EXTRAS = attrgetter(
+    "serialized_content", "original_request.source", "original_request.metadata"
+)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime read from MongoDB as an ISO 8601 string"""
+    return value.isoformat() if value else None
+
 
 class NotificationOrchestrator:
     """
@@ -95,6 +134,7 @@ class NotificationOrchestrator:
             status=NotificationStatus.PENDING,
             created_at=request.created_at,
             original_request=request,
+            serialized_content=self._serialize_content(request.content),
         )
 
         # Save to storage
@@ -122,41 +162,59 @@ class NotificationOrchestrator:
                 task = self._deliver_via_channel(notification, adapter)
                 delivery_tasks.append(task)
 
+        if not delivery_tasks:
+            # Nothing can deliver it; leave it pending instead of broadcasting
+            logger.warning(
+                f"No channel adapter can deliver notification {notification.id}"
+            )
+            return
+
         # Execute all deliveries concurrently
-        if delivery_tasks:
-            delivery_results = await asyncio.gather(
-                *delivery_tasks, return_exceptions=True
+        delivery_results = await asyncio.gather(*delivery_tasks, return_exceptions=True)
+
+        # Split delivery results into statuses and failures in one pass
+        channel_statuses: List[ChannelDeliveryStatus] = []
+        errors: List[BaseException] = []
+        for result in delivery_results:
+            if isinstance(result, ChannelDeliveryStatus):
+                channel_statuses.append(result)
+            elif isinstance(result, BaseException):
+                errors.append(result)
+
+        if errors:
+            logger.error(
+                f"Delivery failed for notification {notification.id}: {errors}"
             )
 
-            # Process delivery results
-            channel_statuses = []
-            for result in delivery_results:
-                if isinstance(result, ChannelDeliveryStatus):
-                    channel_statuses.append(result)
-                elif isinstance(result, Exception):
-                    logger.error(f"Delivery failed: {result}")
+        # Use one timestamp so the stored and broadcast records agree
+        now = datetime.now(timezone.utc)
 
-            # Update the notification record with delivery results
-            await self.storage.update_notification(
-                notification.id,
-                {
-                    "channels": [status.model_dump() for status in channel_statuses],
-                    "status": NotificationStatus.DELIVERED,
-                    "delivered_at": datetime.now(timezone.utc),
-                },
-            )
+        # Update the notification record with delivery results
+        await self.storage.update_notification(
+            notification.id,
+            {
+                # ChannelDeliveryStatus is flat, so a shallow field copy
+                # matches model_dump() without going through the serializer
+                "channels": [dict(status) for status in channel_statuses],
+                "status": NotificationStatus.DELIVERED,
+                "delivered_at": now,
+                "updated_at": now,
+            },
+        )
 
-            # Update the local notification object for broadcasting
-            notification.channels = channel_statuses
-            notification.status = NotificationStatus.DELIVERED
-            notification.delivered_at = datetime.now(timezone.utc)
+        # Update the local notification object for broadcasting
+        notification.channels = channel_statuses
+        notification.status = NotificationStatus.DELIVERED
+        notification.delivered_at = now
 
-            # Broadcast real-time update to user
+        # Broadcast real-time update to user, skipping the serialization
+        # when none of their clients is connected
+        if websocket_manager.has_connections(notification.user_id):
             await websocket_manager.broadcast_to_user(
                 notification.user_id,
                 {
                     "type": "notification.delivered",
-                    "notification": await self._serialize_notification(notification),
+                    "notification": self._serialize_notification(notification),
                 },
             )
 
@@ -250,13 +308,30 @@ class NotificationOrchestrator:
         if result.success:
             notification.mark_action_as_executed(action_id)
 
-            # Update the notification in storage with the executed action
+            # Flip only the executed action in place instead of rewriting the
+            # whole original request
+            updates: Dict[str, Any] = {
+                "original_request.content.actions.$[a].executed": True,
+                "original_request.content.actions.$[a].executed_at": action.executed_at,
+                "updated_at": notification.updated_at,
+            }
+
+            # Keep the precomputed API content in sync with the executed action.
+            # Older notifications have none stored yet, so they get all of it
+            if notification.serialized_content is None:
+                updates["serialized_content"] = self._serialize_content(
+                    notification.original_request.content
+                )
+            else:
+                updates["serialized_content.actions.$[a].executed"] = True
+                updates["serialized_content.actions.$[a].executed_at"] = (
+                    action.model_dump(mode="json", include={"executed_at"})[
+                        "executed_at"
+                    ]
+                )
+
             await self.storage.update_notification(
-                notification_id,
-                {
-                    "original_request": notification.original_request.model_dump(),
-                    "updated_at": notification.updated_at,
-                },
+                notification_id, updates, array_filters=[{"a.id": action_id}]
             )
 
         # Update notification if needed (additional updates from handler)
@@ -268,14 +343,15 @@ class NotificationOrchestrator:
                 f"Broadcasting notification {notification.id} to user {notification.user_id}"
             )
             # Broadcast update to user via websocket
-            await websocket_manager.broadcast_to_user(
-                user_id,
-                {
-                    "type": "notification.updated",
-                    "notification_id": notification_id,
-                    "updates": result.update_notification,
-                },
-            )
+            if websocket_manager.has_connections(user_id):
+                await websocket_manager.broadcast_to_user(
+                    user_id,
+                    {
+                        "type": "notification.updated",
+                        "notification_id": notification_id,
+                        "updates": result.update_notification,
+                    },
+                )
 
         # Handle follow-up actions if any
         if result.next_actions:
@@ -283,15 +359,6 @@ class NotificationOrchestrator:
 
         return result
 
-    def _find_action_in_notification(
-        self, notification: NotificationRecord, action_id: str
-    ):
-        """Find a specific action within a notification."""
-        for action in notification.original_request.content.actions or []:
-            if action.id == action_id:
-                return action
-        return None
-
     async def _handle_follow_up_actions(
         self, next_actions: List[Any], user_id: str
     ) -> None:
@@ -316,31 +383,28 @@ class NotificationOrchestrator:
         Returns:
             Updated notification record if successful, None otherwise
         """
-        notification = await self.storage.get_notification(notification_id, user_id)
-        if not notification:
-            return None
-
         logger.info(
             f"Marking notification {notification_id} as read for user {user_id}"
         )
 
-        await self.storage.update_notification(
+        # Update and fetch the notification in one round trip
+        updated_notification = await self.storage.update_and_return(
             notification_id,
+            user_id,
             {
                 "status": NotificationStatus.READ.value,
                 "read_at": datetime.now(timezone.utc),
             },
         )
-
-        # Get the updated notification
-        updated_notification = await self.storage.get_notification(
-            notification_id, user_id
-        )
+        if not updated_notification:
+            return None
 
         # Broadcast update via websocket
-        await websocket_manager.broadcast_to_user(
-            user_id, {"type": "notification.read", "notification_id": notification_id}
-        )
+        if websocket_manager.has_connections(user_id):
+            await websocket_manager.broadcast_to_user(
+                user_id,
+                {"type": "notification.read", "notification_id": notification_id},
+            )
 
         return updated_notification
 
@@ -355,22 +419,18 @@ class NotificationOrchestrator:
         Returns:
             True if successfully archived, False otherwise
         """
-        notification = await self.storage.get_notification(notification_id, user_id)
-        if not notification:
-            return False
-
         logger.info(f"Archiving notification {notification_id} for user {user_id}")
 
-        await self.storage.update_notification(
+        # Only existence matters here, so skip fetching and validating the record
+        return await self.storage.update_user_notification(
             notification_id,
+            user_id,
             {
-                "status": NotificationStatus.ARCHIVED,
+                "status": NotificationStatus.ARCHIVED.value,
                 "archived_at": datetime.now(timezone.utc),
             },
         )
 
-        return True
-
     # NOTIFICATION RETRIEVAL & QUERIES
     async def get_user_notifications(
         self,
@@ -397,10 +457,12 @@ class NotificationOrchestrator:
         Returns:
             List of serialized notifications
         """
-        notifications = await self.storage.get_user_notifications(
+        # Listing is read-only, so reshape the raw documents directly instead
+        # of validating them into models only to serialize them again
+        docs = await self.storage.get_user_notifications_raw(
             user_id, status, limit, offset, channel_type, notification_type, source
         )
-        return [await self._serialize_notification(n) for n in notifications]
+        return [self._reshape_doc(doc) for doc in docs]
 
     async def get_notification(
         self, notification_id: str, user_id: str
@@ -418,7 +480,7 @@ class NotificationOrchestrator:
         notification = await self.storage.get_notification(notification_id, user_id)
         if not notification:
             return None
-        return await self._serialize_notification(notification)
+        return self._serialize_notification(notification)
 
     # BULK OPERATIONS
     async def bulk_actions(
@@ -435,27 +497,54 @@ class NotificationOrchestrator:
         Returns:
             Dictionary mapping notification IDs to success/failure status
         """
-        results = {}
-
-        for notification_id in notification_ids:
-            try:
-                if action == BulkActions.MARK_READ:
-                    result = await self.mark_as_read(notification_id, user_id)
-                    success = result is not None
-                elif action == BulkActions.ARCHIVE:
-                    success = await self.archive_notification(notification_id, user_id)
-                else:
-                    success = False
+        now = datetime.now(timezone.utc)
+        if action == BulkActions.MARK_READ:
+            status = NotificationStatus.READ
+            timestamp_field = "read_at"
+        elif action == BulkActions.ARCHIVE:
+            status = NotificationStatus.ARCHIVED
+            timestamp_field = "archived_at"
+        else:
+            return {notification_id: False for notification_id in notification_ids}
+        updates: Dict[str, Any] = {"status": status.value, timestamp_field: now}
+
+        # One update for all notifications instead of a read and a write per ID.
+        # Read receipts are idempotent, so they skip the write acknowledgement
+        try:
+            updated_ids = set(
+                await self.storage.bulk_update(
+                    notification_ids,
+                    user_id,
+                    updates,
+                    durable=action != BulkActions.MARK_READ,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Bulk action {action.value} failed for user {user_id}: {e}")
+            return {notification_id: False for notification_id in notification_ids}
 
-                results[notification_id] = success
-            except Exception as e:
-                logger.error(f"Bulk action failed for {notification_id}: {e}")
-                results[notification_id] = False
+        if updated_ids and websocket_manager.has_connections(user_id):
+            # Let the user's clients know about all changes in a single message
+            await websocket_manager.broadcast_to_user(
+                user_id,
+                {
+                    "type": "notification.bulk_updated",
+                    "notification_ids": list(updated_ids),
+                    "status": status.value,
+                    "updates": {
+                        "status": status.value,
+                        timestamp_field: now.isoformat(),
+                    },
+                },
+            )
 
-        return results
+        return {
+            notification_id: notification_id in updated_ids
+            for notification_id in notification_ids
+        }
 
     # UTILITY & SERIALIZATION METHODS
-    async def _serialize_notification(
+    def _serialize_notification(
         self, notification: NotificationRecord
     ) -> Dict[str, Any]:
         """
@@ -467,58 +556,98 @@ class NotificationOrchestrator:
         Returns:
             Dictionary representation suitable for API responses
         """
+        # Let pydantic-core dump the fields in one pass instead of building
+        # the nested dicts (and isoformat strings) by hand
+        data = notification.model_dump(mode="json", include=_RECORD_FIELDS)
+
+        serialized_content, source, metadata = _RECORD_EXTRAS(notification)
+        data["content"] = serialized_content or self._serialize_content(
+            notification.original_request.content
+        )
+        data["source"] = source
+        data["metadata"] = metadata
+        return data
+
+    def _serialize_content(self, content: NotificationContent) -> Dict[str, Any]:
+        """
+        Serialize notification content (title, body and actions) for API responses.
+
+        Args:
+            content: The notification content to serialize
+
+        Returns:
+            JSON-compatible dictionary of the content
+        """
         return {
-            "id": notification.id,
-            "user_id": notification.user_id,
-            "status": notification.status.value,
-            "created_at": notification.created_at.isoformat(),
-            "delivered_at": (
-                notification.delivered_at.isoformat()
-                if notification.delivered_at
-                else None
-            ),
-            "read_at": (
-                notification.read_at.isoformat() if notification.read_at else None
-            ),
-            "snoozed_until": (
-                notification.snoozed_until.isoformat()
-                if notification.snoozed_until
-                else None
-            ),
-            "content": {
-                "title": notification.original_request.content.title,
-                "body": notification.original_request.content.body,
-                "actions": [
-                    {
-                        "id": action.id,
-                        "type": action.type.value,
-                        "label": action.label,
-                        "style": action.style.value,
-                        "requires_confirmation": action.requires_confirmation,
-                        "confirmation_message": action.confirmation_message,
-                        "config": action.config.model_dump() if action.config else None,
-                        "executed": action.executed,
-                        "executed_at": (
-                            action.executed_at.isoformat()
-                            if action.executed_at
-                            else None
-                        ),
-                        "disabled": action.disabled,
-                    }
-                    for action in (notification.original_request.content.actions or [])
-                ],
-            },
-            "source": notification.original_request.source,
-            "metadata": notification.original_request.metadata,
+            "title": content.title,
+            "body": content.body,
+            "actions": [
+                action.model_dump(mode="json", include=_ACTION_FIELDS)
+                for action in (content.actions or [])
+            ],
+        }
+
+    def _reshape_doc(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reshape a raw notification document into the API response format.
+
+        Produces the same structure as _serialize_notification without
+        building a NotificationRecord first.
+
+        Args:
+            doc: Notification document as stored in MongoDB
+
+        Returns:
+            Dictionary representation suitable for API responses
+        """
+        request = doc.get("original_request") or {}
+
+        # Notifications created before content was precomputed are built from
+        # their original request instead
+        serialized_content = doc.get("serialized_content")
+        if serialized_content is None:
+            serialized_content = self._reshape_content(doc.get("legacy_content") or {})
+
+        return {
+            "id": doc["id"],
+            "user_id": doc["user_id"],
+            "status": doc.get("status", NotificationStatus.PENDING.value),
+            "created_at": _isoformat(doc.get("created_at")),
+            "delivered_at": _isoformat(doc.get("delivered_at")),
+            "read_at": _isoformat(doc.get("read_at")),
+            "snoozed_until": _isoformat(doc.get("snoozed_until")),
             "channels": [
                 {
-                    "channel_type": ch.channel_type,
-                    "status": ch.status.value,
-                    "delivered_at": (
-                        ch.delivered_at.isoformat() if ch.delivered_at else None
-                    ),
-                    "error_message": ch.error_message,
+                    "channel_type": ch.get("channel_type"),
+                    "status": ch.get("status"),
+                    "delivered_at": _isoformat(ch.get("delivered_at")),
+                    "error_message": ch.get("error_message"),
+                }
+                for ch in doc.get("channels") or []
+            ],
+            "content": serialized_content,
+            "source": request.get("source"),
+            "metadata": request.get("metadata") or {},
+        }
+
+    def _reshape_content(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Reshape raw notification content from MongoDB for API responses."""
+        return {
+            "title": content.get("title"),
+            "body": content.get("body"),
+            "actions": [
+                {
+                    "id": action.get("id"),
+                    "type": action.get("type"),
+                    "label": action.get("label"),
+                    "style": action.get("style", "secondary"),
+                    "config": action.get("config"),
+                    "requires_confirmation": action.get("requires_confirmation", False),
+                    "confirmation_message": action.get("confirmation_message"),
+                    "disabled": action.get("disabled", False),
+                    "executed": action.get("executed", False),
+                    "executed_at": _isoformat(action.get("executed_at")),
                 }
-                for ch in notification.channels
+                for action in content.get("actions") or []
             ],
         }
@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config.loggers import app_logger as logger
 from app.db.mongodb.collections import (
@@ -11,6 +12,14 @@ from app.models.notification.notification_models import (
     NotificationType,
     NotificationSourceEnum,
 )
+from pymongo import ReturnDocument
+from pymongo.write_concern import WriteConcern
+
+# Unacknowledged writes for idempotent updates that tolerate rare loss, such
+# as read receipts; the caller does not wait for the server to apply them
+_unacknowledged_notifications = notifications_collection.with_options(
+    write_concern=WriteConcern(w=0)
+)
 
 # class NotificationStorage(ABC):
 #     """Abstract storage interface"""
@@ -53,6 +62,31 @@ from app.models.notification.notification_models import (
 #         pass
 
 
+# Fields returned when listing notifications for the API
+_LISTING_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "user_id": 1,
+    "status": 1,
+    "created_at": 1,
+    "delivered_at": 1,
+    "read_at": 1,
+    "snoozed_until": 1,
+    "channels": 1,
+    "original_request.source": 1,
+    "original_request.metadata": 1,
+    "serialized_content": 1,
+    # Raw content is only needed for notifications without precomputed content
+    "legacy_content": {
+        "$cond": [
+            {"$ifNull": ["$serialized_content", False]},
+            "$$REMOVE",
+            "$original_request.content",
+        ]
+    },
+}
+
+
 class MongoDBNotificationStorage:
     """MongoDB storage implementation for notifications"""
 
@@ -74,16 +108,36 @@ class MongoDBNotificationStorage:
         return None
 
     async def update_notification(
-        self, notification_id: str, updates: Dict[str, Any]
+        self,
+        notification_id: str,
+        updates: Dict[str, Any],
+        durable: bool = True,
+        array_filters: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
-        """Update a notification's fields"""
-        updates["updated_at"] = datetime.now(timezone.utc)
+        """
+        Update a notification's fields.
+
+        Pass durable=False for idempotent updates that may be lost on rare
+        failures; the write is then sent without waiting for acknowledgement.
+        array_filters is passed through for updates to filtered positional
+        paths such as "actions.$[a].executed".
+        """
+        if "updated_at" not in updates:
+            updates["updated_at"] = datetime.now(timezone.utc)
+
+        if not durable:
+            await _unacknowledged_notifications.update_one(
+                {"id": notification_id},
+                {"$set": updates},
+                array_filters=array_filters,
+            )
+            return
 
         # Debug logging
         logger.info(f"Updating notification {notification_id} with updates: {updates}")
 
         result = await notifications_collection.update_one(
-            {"id": notification_id}, {"$set": updates}
+            {"id": notification_id}, {"$set": updates}, array_filters=array_filters
         )
 
         # Log the result
@@ -98,6 +152,72 @@ class MongoDBNotificationStorage:
         else:
             logger.info(f"Successfully updated notification {notification_id}")
 
+    async def update_user_notification(
+        self, notification_id: str, user_id: str, updates: Dict[str, Any]
+    ) -> bool:
+        """
+        Update a user's notification without reading it back.
+
+        Returns whether the notification exists for the user.
+        """
+        updates["updated_at"] = datetime.now(timezone.utc)
+
+        result = await notifications_collection.update_one(
+            {"id": notification_id, "user_id": user_id}, {"$set": updates}
+        )
+        return result.matched_count > 0
+
+    async def update_and_return(
+        self, notification_id: str, user_id: str, updates: Dict[str, Any]
+    ) -> Optional[NotificationRecord]:
+        """
+        Update a user's notification and return it in a single round trip.
+
+        Returns None if the notification does not exist for the user.
+        """
+        updates["updated_at"] = datetime.now(timezone.utc)
+
+        result = await notifications_collection.find_one_and_update(
+            {"id": notification_id, "user_id": user_id},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER,
+        )
+        if result:
+            return NotificationRecord.model_validate(result)
+        return None
+
+    async def bulk_update(
+        self,
+        notification_ids: List[str],
+        user_id: str,
+        updates: Dict[str, Any],
+        durable: bool = True,
+    ) -> List[str]:
+        """
+        Apply the same updates to several of a user's notifications at once.
+
+        With durable=False the update is not acknowledged, so only the
+        existence check is waited on.
+
+        Returns the IDs of the notifications that exist for the user.
+        """
+        collection = (
+            notifications_collection if durable else _unacknowledged_notifications
+        )
+        query = {"id": {"$in": notification_ids}, "user_id": user_id}
+        updates["updated_at"] = datetime.now(timezone.utc)
+
+        # The update does not touch id or user_id, so the existence check and
+        # the update can run concurrently instead of back to back
+        found, _ = await asyncio.gather(
+            notifications_collection.find(query, {"_id": 0, "id": 1}).to_list(
+                length=None
+            ),
+            collection.update_many(query, {"$set": updates}),
+        )
+
+        return [doc["id"] for doc in found]
+
     async def get_user_notifications(
         self,
         user_id: str,
@@ -109,24 +229,13 @@ class MongoDBNotificationStorage:
         source: Optional[NotificationSourceEnum] = None,
     ) -> List[NotificationRecord]:
         """Get user's notifications with optional filtering"""
-        query = {"user_id": user_id}
-        if status is not None:
-            query["status"] = status
-
-        # Filter by channel type if specified
-        if channel_type is not None:
-            query["channels.channel_type"] = channel_type
-
-        # Filter by notification type if specified
-        if notification_type is not None:
-            query["notification_type"] = notification_type
-
-        # Filter by source if specified
-        if source is not None:
-            query["source"] = source
+        query = self._build_user_query(
+            user_id, status, channel_type, notification_type, source
+        )
 
         cursor = notifications_collection.find(query)
         cursor = cursor.sort("created_at", -1).skip(offset).limit(limit)
+        cursor = cursor.hint(self._listing_hint(status, channel_type))
 
         results = await cursor.to_list(length=limit)
 
@@ -140,6 +249,69 @@ class MongoDBNotificationStorage:
 
         return [NotificationRecord.model_validate(doc) for doc in results]
 
+    async def get_user_notifications_raw(
+        self,
+        user_id: str,
+        status: Optional[NotificationStatus] = None,
+        limit: int = 50,
+        offset: int = 0,
+        channel_type: Optional[str] = None,
+        notification_type: Optional[NotificationType] = None,
+        source: Optional[NotificationSourceEnum] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get user's notifications as raw documents, without model validation.
+
+        Only the fields needed to build API responses are fetched.
+        """
+        query = self._build_user_query(
+            user_id, status, channel_type, notification_type, source
+        )
+
+        cursor = notifications_collection.find(query, _LISTING_PROJECTION)
+        cursor = cursor.sort("created_at", -1).skip(offset).limit(limit)
+        cursor = cursor.hint(self._listing_hint(status, channel_type))
+
+        return await cursor.to_list(length=limit)
+
+    @staticmethod
+    def _listing_hint(
+        status: Optional[NotificationStatus], channel_type: Optional[str]
+    ) -> List[Tuple[str, int]]:
+        """Pick the index that serves both the filters and the created_at sort"""
+        if status is not None:
+            return [("user_id", 1), ("status", 1), ("created_at", -1)]
+        if channel_type is not None:
+            return [("user_id", 1), ("channels.channel_type", 1), ("created_at", -1)]
+        return [("user_id", 1), ("created_at", -1)]
+
+    def _build_user_query(
+        self,
+        user_id: str,
+        status: Optional[NotificationStatus] = None,
+        channel_type: Optional[str] = None,
+        notification_type: Optional[NotificationType] = None,
+        source: Optional[NotificationSourceEnum] = None,
+    ) -> Dict[str, Any]:
+        """Build the query for listing a user's notifications"""
+        query: Dict[str, Any] = {"user_id": user_id}
+        if status is not None:
+            query["status"] = status
+
+        # Filter by channel type if specified
+        if channel_type is not None:
+            query["channels.channel_type"] = channel_type
+
+        # Filter by notification type if specified
+        if notification_type is not None:
+            query["notification_type"] = notification_type
+
+        # Filter by source if specified
+        if source is not None:
+            query["source"] = source
+
+        return query
+
     async def get_notification_count(
         self,
         user_id: str,
@@ -153,4 +325,6 @@ class MongoDBNotificationStorage:
         if channel_type is not None:
             query["channels.channel_type"] = channel_type
 
-        return await notifications_collection.count_documents(query)
+        return await notifications_collection.count_documents(
+            query, hint=self._listing_hint(status, channel_type)
+        )
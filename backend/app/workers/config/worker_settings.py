@@ -29,6 +29,9 @@ class WorkerSettings:
 
     # Performance settings
     max_jobs = 10
+    # Read only as many queued job IDs per poll as can start, instead of
+    # arq's default of max(max_jobs * 5, 100), to cut wasted Redis calls
+    queue_read_limit = max_jobs
     job_timeout = 300  # 5 minutes
     keep_result = 0  # Don't keep results in Redis
     log_results = True
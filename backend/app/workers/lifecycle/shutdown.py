@@ -12,7 +12,11 @@ async def shutdown(ctx: dict):
     logger.info("ARQ worker shutting down...")
 
     # Clean up any resources if needed
+    workflow_scheduler = ctx.get("workflow_scheduler")
+    if workflow_scheduler:
+        await workflow_scheduler.close()
+
     startup_time = ctx.get("startup_time", 0)
     if startup_time:
-        runtime = asyncio.get_event_loop().time() - startup_time
+        runtime = asyncio.get_running_loop().time() - startup_time
         logger.info(f"ARQ worker ran for {runtime:.2f} seconds")
@@ -5,7 +5,9 @@ ARQ worker startup functionality.
 import asyncio
 
 from app.config.loggers import arq_worker_logger as logger
+from app.db.mongodb.collections import workflows_collection
 from app.langchain.llm.client import register_llm_providers
+from app.services.workflow.scheduler import WorkflowScheduler
 
 
 async def startup(ctx: dict):
@@ -16,10 +18,22 @@ async def startup(ctx: dict):
     logger.info("ARQ worker starting up...")
 
     # Initialize any resources needed by worker
-    ctx["startup_time"] = asyncio.get_event_loop().time()
+    ctx["startup_time"] = asyncio.get_running_loop().time()
 
     register_llm_providers()
 
+    # One workflow scheduler for every task instead of one per execution
+    workflow_scheduler = WorkflowScheduler()
+    await workflow_scheduler.initialize()
+    ctx["workflow_scheduler"] = workflow_scheduler
+
+    # Open the MongoDB connection now, so the first task does not pay for
+    # server selection, the handshake and authentication
+    try:
+        await workflows_collection.database.command("ping")
+    except Exception as e:
+        logger.warning(f"Could not warm up the MongoDB connection: {e}")
+
     # Build the normal graph (same as main app) but with in-memory checkpointer for ARQ worker
     async with (
         build_graph(
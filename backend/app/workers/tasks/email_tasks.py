@@ -0,0 +1,110 @@
+"""
+Email worker functions for ARQ task processing.
+Runs a user's email-triggered workflows for each incoming email.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from app.config.loggers import arq_worker_logger as logger
+from app.db.mongodb.collections import workflows_collection
+from app.services.trigger_matching_service import find_matching_workflows
+from app.workers.tasks.workflow_tasks import (
+    create_workflow_completion_notification,
+    execute_workflow_as_chat,
+)
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Maximum number of workflows executed concurrently for a single email
+MAX_CONCURRENT_WORKFLOWS = 8
+
+
+async def process_email_task(ctx: dict, user_id: str, email_data: dict) -> str:
+    """
+    Execute the user's email-triggered workflows for an incoming email.
+
+    Args:
+        ctx: ARQ context
+        user_id: ID of the user who received the email
+        email_data: Email data from the webhook
+
+    Returns:
+        Processing result message
+    """
+    message_id = email_data.get("message_id", "unknown")
+    # Loguru formats the arguments only if the record is actually emitted
+    logger.info("Processing email {} for user {}", message_id, user_id)
+
+    matching_workflows = await find_matching_workflows(user_id)
+    if not matching_workflows:
+        return f"No workflows to execute for email {message_id}"
+
+    now = datetime.now(timezone.utc)
+    trigger_context = {
+        "type": "gmail",
+        "email_data": email_data,
+        "triggered_at": now.isoformat(),
+    }
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_WORKFLOWS)
+
+    async def run_workflow(workflow) -> bool:
+        """Execute one workflow, returning whether it succeeded."""
+        async with semaphore:
+            try:
+                execution_messages = await execute_workflow_as_chat(
+                    workflow, {"user_id": user_id}, trigger_context
+                )
+                await create_workflow_completion_notification(
+                    workflow, execution_messages, user_id
+                )
+                return True
+            except Exception as e:
+                logger.error(
+                    f"Failed to execute workflow {workflow.id} for email {message_id}: {e}"
+                )
+                return False
+
+    # Workflows are independent, so run them concurrently up to the limit.
+    # run_workflow handles its own errors, so one failure cancels no others
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(run_workflow(wf)) for wf in matching_workflows]
+    results = [task.result() for task in tasks]
+
+    # Collect the statistics updates and write them together
+    stats_ops = []
+    for workflow, succeeded in zip(matching_workflows, results):
+        query = {"_id": workflow.id, "user_id": user_id}
+        if succeeded:
+            stats_ops.append(
+                UpdateOne(
+                    query,
+                    {
+                        "$inc": {"total_executions": 1, "successful_executions": 1},
+                        "$set": {"last_executed_at": now},
+                    },
+                )
+            )
+        else:
+            stats_ops.append(UpdateOne(query, {"$inc": {"total_executions": 1}}))
+    executed_count = sum(results)
+
+    # One round trip for the statistics of every executed workflow. Unordered,
+    # so one failed update does not stop the others
+    try:
+        await workflows_collection.bulk_write(stats_ops, ordered=False)
+    except BulkWriteError as e:
+        logger.error(
+            f"Failed to update some workflow stats for email {message_id}: "
+            f"{e.details.get('writeErrors')}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to update workflow stats for email {message_id}: {e}")
+
+    result = (
+        f"Executed {executed_count}/{len(matching_workflows)} workflows "
+        f"for email {message_id}"
+    )
+    logger.info(result)
+    return result
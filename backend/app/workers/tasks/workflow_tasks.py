@@ -3,13 +3,16 @@ Workflow worker functions for ARQ task processing.
 Contains all workflow-related background tasks and execution logic.
 """
 
+import asyncio
+import hashlib
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 from app.config.loggers import arq_worker_logger as logger
 from app.config.token_repository import token_repository
+from app.db.mongodb.collections import todos_collection
 from app.langchain.core.agent import call_agent_silent
 from app.middleware.tiered_rate_limiter import tiered_rate_limit
 from app.models.chat_models import MessageModel
@@ -17,12 +20,34 @@ from app.models.message_models import (
     MessageRequestWithHistory,
     SelectedWorkflowData,
 )
+from app.models.notification.notification_models import (
+    ActionConfig,
+    ActionStyle,
+    ActionType,
+    ChannelConfig,
+    NotificationAction,
+    NotificationContent,
+    NotificationRequest,
+    NotificationSourceEnum,
+    RedirectConfig,
+)
+from app.models.workflow_models import (
+    CreateWorkflowRequest,
+    TriggerConfig,
+    TriggerType,
+)
 from app.services.model_service import get_user_selected_model
+from app.services.notification_service import notification_service
+from app.services.todo_service import TodoService
 from app.services.user_service import get_user_by_id
 from app.services.workflow.conversation_service import (
+    add_workflow_execution_messages,
     get_or_create_workflow_conversation,
 )
+from app.services.workflow.scheduler import WorkflowScheduler
+from app.services.workflow.service import WorkflowService
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 
 async def get_user_authentication_tokens(
@@ -74,6 +99,21 @@ async def get_user_authentication_tokens(
         return None, None
 
 
+def _workflow_generation_key(title: str, description: str) -> str:
+    """Hash the todo fields a generated workflow is based on."""
+    payload = f"{title}\0{description or ''}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _to_object_id(todo_id: Any) -> Optional[ObjectId]:
+    """Get a todo's ObjectId from either an ObjectId or its hex string."""
+    if isinstance(todo_id, ObjectId):
+        return todo_id
+    if isinstance(todo_id, str) and ObjectId.is_valid(todo_id):
+        return ObjectId(todo_id)
+    return None
+
+
 async def process_workflow_generation_task(
     ctx: dict, todo_id: str, user_id: str, title: str, description: str = ""
 ) -> str:
@@ -91,18 +131,28 @@ async def process_workflow_generation_task(
     Returns:
         Processing result message
     """
-    from app.db.mongodb.collections import todos_collection
-    from app.models.workflow_models import (
-        CreateWorkflowRequest,
-        TriggerConfig,
-        TriggerType,
-    )
-    from app.services.todo_service import TodoService
-    from app.services.workflow.service import WorkflowService
-
-    logger.info(f"Processing workflow generation for todo {todo_id}: {title}")
+    logger.info("Processing workflow generation for todo {}: {}", todo_id, title)
 
     try:
+        todo_oid = _to_object_id(todo_id)
+        if todo_oid is None:
+            raise ValueError(f"Invalid todo_id {todo_id}")
+
+        # Verify ownership before generating, so a missing todo costs no
+        # workflow generation
+        todo = await todos_collection.find_one(
+            {"_id": todo_oid, "user_id": user_id},
+            {"workflow_id": 1, "workflow_gen_key": 1},
+        )
+        if todo is None:
+            raise ValueError(f"Todo {todo_id} not found")
+
+        # Retries and duplicate enqueues for an unchanged todo reuse the
+        # workflow already linked instead of generating another one
+        gen_key = _workflow_generation_key(title, description)
+        if todo.get("workflow_id") and todo.get("workflow_gen_key") == gen_key:
+            return f"Todo {todo_id} already has workflow {todo['workflow_id']}"
+
         # Create standalone workflow using the new workflow system
         workflow_request = CreateWorkflowRequest(
             title=f"Todo: {title}",
@@ -117,20 +167,27 @@ async def process_workflow_generation_task(
             # Update the todo with the workflow_id for linking
             update_data = {
                 "workflow_id": workflow.id,
+                "workflow_gen_key": gen_key,
                 "updated_at": datetime.now(timezone.utc),
             }
 
-            result = await todos_collection.update_one(
-                {"_id": ObjectId(todo_id), "user_id": user_id}, {"$set": update_data}
+            # Link and confirm the todo still exists in one round trip
+            linked_todo = await todos_collection.find_one_and_update(
+                {"_id": todo_oid, "user_id": user_id},
+                {"$set": update_data},
+                projection={"user_id": 1},
+                return_document=ReturnDocument.AFTER,
             )
 
-            if result.modified_count > 0:
+            if linked_todo is not None:
                 logger.info(
                     f"Successfully generated and linked standalone workflow {workflow.id} for todo {todo_id} with {len(workflow.steps)} steps"
                 )
 
                 # Invalidate cache for this todo
-                await TodoService._invalidate_cache(user_id, None, todo_id, "update")
+                await TodoService._invalidate_cache(
+                    linked_todo["user_id"], None, todo_id, "update"
+                )
 
                 return f"Successfully generated standalone workflow {workflow.id} for todo {todo_id}"
             else:
@@ -170,31 +227,23 @@ async def execute_workflow_by_id(
     logger.info(f"Processing workflow execution: {workflow_id}")
 
     try:
-        # Get workflow from database
-        from app.services.workflow.scheduler import WorkflowScheduler
-
-        scheduler = WorkflowScheduler()
-        await scheduler.initialize()
-
-        try:
-            workflow = await scheduler.get_task(workflow_id)
-            if not workflow:
-                return f"Workflow {workflow_id} not found"
-
-            # Execute the workflow and get messages
-            execution_messages = await execute_workflow_as_chat(
-                workflow, {"user_id": workflow.user_id}, context or {}
-            )
-
-            # Store messages and send notification
-            await create_workflow_completion_notification(
-                workflow, execution_messages, workflow.user_id
-            )
+        # Get workflow from database with the worker's shared scheduler
+        scheduler: WorkflowScheduler = ctx["workflow_scheduler"]
+        workflow = await scheduler.get_task(workflow_id)
+        if not workflow:
+            return f"Workflow {workflow_id} not found"
+
+        # Execute the workflow and get messages
+        execution_messages = await execute_workflow_as_chat(
+            workflow, {"user_id": workflow.user_id}, context or {}
+        )
 
-            return f"Workflow {workflow_id} executed successfully with {len(execution_messages)} messages"
+        # Store messages and send notification
+        await create_workflow_completion_notification(
+            workflow, execution_messages, workflow.user_id
+        )
 
-        finally:
-            await scheduler.close()
+        return f"Workflow {workflow_id} executed successfully with {len(execution_messages)} messages"
 
     except Exception as e:
         error_msg = f"Error executing workflow {workflow_id}: {str(e)}"
@@ -202,6 +251,18 @@ async def execute_workflow_by_id(
         return error_msg
 
 
+def _build_message(type_: str, response: str, date: str, **fields) -> MessageModel:
+    """
+    Build a workflow execution message from values created locally.
+
+    Skips pydantic validation, so only pass fields that already have the
+    right types. Messages carrying agent output are validated as usual.
+    """
+    return MessageModel.model_construct(
+        type=type_, response=response, date=date, message_id=str(uuid4()), **fields
+    )
+
+
 @tiered_rate_limit("email_workflow_executions")
 async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
     """
@@ -224,8 +285,30 @@ async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
             f"Executing workflow {workflow.id} as chat session for user {user_id}"
         )
 
-        # Get user tokens for authentication (same as chat stream)
-        access_token, refresh_token = await get_user_authentication_tokens(user_id)
+        # These lookups are independent of each other, so run them concurrently.
+        # Failures are returned rather than raised, so that the user data and
+        # model config can fall back to defaults as before
+        tokens, user_data, user_model_config, conversation = await asyncio.gather(
+            # Get user tokens for authentication (same as chat stream)
+            get_user_authentication_tokens(user_id),
+            get_user_by_id(user_id),
+            get_user_selected_model(user_id),
+            # Get or create the workflow conversation for thread context
+            get_or_create_workflow_conversation(
+                workflow_id=workflow.id,
+                user_id=user_id,
+                workflow_title=workflow.title,
+            ),
+            return_exceptions=True,
+        )
+
+        # The workflow cannot run without its tokens or conversation
+        if isinstance(tokens, BaseException):
+            raise tokens
+        if isinstance(conversation, BaseException):
+            raise conversation
+
+        access_token, refresh_token = tokens
 
         if not access_token:
             logger.error(
@@ -236,9 +319,10 @@ async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
                 f"Access token available for user {user_id} - tools can authenticate"
             )
 
-        # Get user data and create timezone-aware datetime
+        # Use the user data to create a timezone-aware datetime
         try:
-            user_data = await get_user_by_id(user_id)
+            if isinstance(user_data, BaseException):
+                raise user_data
             if user_data:
                 user_data["user_id"] = user_id  # Ensure user_id is present
                 user_tz = ZoneInfo(user_data.get("timezone", "UTC"))
@@ -251,20 +335,11 @@ async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
             user_data = {"user_id": user_id}
             user_time = datetime.now(timezone.utc)
 
-        user_model_config = None
-        try:
-            user_model_config = await get_user_selected_model(user_id)
-        except Exception as e:
+        if isinstance(user_model_config, BaseException):
             logger.warning(
-                f"Could not get user's selected model for workflow, using default: {e}"
+                f"Could not get user's selected model for workflow, using default: {user_model_config}"
             )
-
-        # Get or create the workflow conversation for thread context
-        conversation = await get_or_create_workflow_conversation(
-            workflow_id=workflow.id,
-            user_id=user_id,
-            workflow_title=workflow.title,
-        )
+            user_model_config = None
 
         # Convert workflow steps to the format expected by SelectedWorkflowData
         workflow_steps = []
@@ -308,14 +383,11 @@ async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
 
         # Create execution messages with proper tool data
         execution_messages = []
+        message_date = datetime.now(timezone.utc).isoformat()
 
         # Create a simple user message showing workflow execution (like frontend)
-        user_message = MessageModel(
-            type="user",
-            response="",
-            date=datetime.now(timezone.utc).isoformat(),
-            message_id=str(uuid4()),
-            selectedWorkflow=selected_workflow_data,
+        user_message = _build_message(
+            "user", "", message_date, selectedWorkflow=selected_workflow_data
         )
         execution_messages.append(user_message)
 
@@ -323,7 +395,7 @@ async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
         bot_message = MessageModel(
             type="bot",
             response=complete_message,
-            date=datetime.now(timezone.utc).isoformat(),
+            date=message_date,
             message_id=str(uuid4()),
             **tool_data,  # Include all captured tool data
         )
@@ -337,34 +409,39 @@ async def execute_workflow_as_chat(workflow, user: dict, context: dict) -> list:
     except Exception as e:
         logger.error(f"Failed to execute workflow {workflow.id} as chat: {str(e)}")
         # Return error message
-        error_message = MessageModel(
-            type="bot",
-            response=f"❌ **Workflow Execution Failed**\n\nWorkflow: {workflow.title}\nError: {str(e)}",
-            date=datetime.now(timezone.utc).isoformat(),
-            message_id=str(uuid4()),
+        error_message = _build_message(
+            "bot",
+            f"❌ **Workflow Execution Failed**\n\nWorkflow: {workflow.title}\nError: {str(e)}",
+            datetime.now(timezone.utc).isoformat(),
         )
         return [error_message]
 
 
 def format_workflow_steps_as_prompt(workflow) -> str:
     """Convert workflow steps into a natural language prompt for LLM execution."""
-    prompt = f"""Please execute the following workflow steps in sequence:
+    parts = [
+        f"""Please execute the following workflow steps in sequence:
 
 **Workflow Goal**: {getattr(workflow, "description", "Complete the defined workflow tasks")}
 
 **Steps to execute**:
 """
+    ]
 
+    # Collect the pieces and join once instead of growing the prompt per line
     for i, step in enumerate(workflow.steps, 1):
-        prompt += f"\n{i}. **{step.title}**"
-        prompt += f"\n   - Description: {step.description}"
-        prompt += f"\n   - Tool: {step.tool_name}"
-        if hasattr(step, "tool_inputs") and step.tool_inputs:
-            prompt += f"\n   - Inputs: {step.tool_inputs}"
-        prompt += "\n"
-
-    prompt += "\nExecute each step using the appropriate tools and provide the results."
-    return prompt
+        parts.append(f"\n{i}. **{step.title}**")
+        parts.append(f"\n   - Description: {step.description}")
+        parts.append(f"\n   - Tool: {step.tool_name}")
+        tool_inputs = getattr(step, "tool_inputs", None)
+        if tool_inputs:
+            parts.append(f"\n   - Inputs: {tool_inputs}")
+        parts.append("\n")
+
+    parts.append(
+        "\nExecute each step using the appropriate tools and provide the results."
+    )
+    return "".join(parts)
 
 
 async def regenerate_workflow_steps(
@@ -392,9 +469,6 @@ async def regenerate_workflow_steps(
     )
 
     try:
-        # Import here to avoid circular imports
-        from app.services.workflow import WorkflowService
-
         # Regenerate steps using the service method (without background queue)
         await WorkflowService.regenerate_workflow_steps(
             workflow_id,
@@ -428,9 +502,6 @@ async def generate_workflow_steps(ctx: dict, workflow_id: str, user_id: str) ->
     logger.info(f"Generating workflow steps: {workflow_id} for user {user_id}")
 
     try:
-        # Import here to avoid circular imports
-        from app.services.workflow import WorkflowService
-
         # Generate steps using the service method
         await WorkflowService._generate_workflow_steps(workflow_id, user_id)
 
@@ -449,24 +520,6 @@ async def create_workflow_completion_notification(
 ):
     """Create or update workflow conversation with execution results and send notification."""
     try:
-        # Import here to avoid circular imports
-        from app.models.notification.notification_models import (
-            ActionConfig,
-            ActionStyle,
-            ActionType,
-            ChannelConfig,
-            NotificationAction,
-            NotificationContent,
-            NotificationRequest,
-            NotificationSourceEnum,
-            RedirectConfig,
-        )
-        from app.services.notification_service import notification_service
-        from app.services.workflow.conversation_service import (
-            add_workflow_execution_messages,
-            get_or_create_workflow_conversation,
-        )
-
         # Get or create the workflow's persistent conversation
         conversation = await get_or_create_workflow_conversation(
             workflow_id=workflow.id,
@@ -474,14 +527,6 @@ async def create_workflow_completion_notification(
             workflow_title=workflow.title,
         )
 
-        # Add execution messages to the conversation
-        if execution_messages:
-            await add_workflow_execution_messages(
-                conversation_id=conversation["conversation_id"],
-                workflow_execution_messages=execution_messages,
-                user_id=user_id,
-            )
-
         # Send notification with action to view results
         notification_request = NotificationRequest(
             user_id=user_id,
@@ -511,8 +556,37 @@ async def create_workflow_completion_notification(
             },
         )
 
-        await notification_service.create_notification(notification_request)
-        logger.info(f"Sent workflow completion notification for workflow {workflow.id}")
+        # Storing the messages and sending the notification are independent,
+        # so a failure in one must not hide the outcome of the other
+        steps = [
+            (
+                "create workflow completion notification",
+                notification_service.create_notification(notification_request),
+            )
+        ]
+        if execution_messages:
+            steps.append(
+                (
+                    f"store execution messages for workflow {workflow.id}",
+                    add_workflow_execution_messages(
+                        conversation_id=conversation["conversation_id"],
+                        workflow_execution_messages=execution_messages,
+                        user_id=user_id,
+                    ),
+                )
+            )
+        results = await asyncio.gather(
+            *(step for _, step in steps), return_exceptions=True
+        )
+
+        for (action, _), result in zip(steps, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to {action}: {str(result)}")
+
+        if not isinstance(results[0], BaseException):
+            logger.info(
+                f"Sent workflow completion notification for workflow {workflow.id}"
+            )
 
     except Exception as e:
         logger.error(f"Failed to create workflow completion notification: {str(e)}")
@@ -0,0 +1,38 @@
+"""
+Regression checks for cron scheduling around DST transitions.
+"""
+
+from datetime import datetime, timezone
+
+from app.utils.cron_utils import get_next_run_time
+
+NEW_YORK = "America/New_York"
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_fall_back_fires_in_repeated_hour_after_base():
+    # 06:03Z is 01:03 EST, inside the repeated hour of 2024-11-03
+    base = _utc(2024, 11, 3, 6, 3)
+    assert get_next_run_time("15 1 * * *", base, NEW_YORK) == _utc(2024, 11, 3, 6, 15)
+
+
+def test_spring_forward_skips_nonexistent_time():
+    # 02:30 does not exist on 2024-03-10; the job runs when the clocks jump
+    base = _utc(2024, 3, 10, 6, 3)
+    assert get_next_run_time("30 2 * * *", base, NEW_YORK) == _utc(2024, 3, 10, 7, 0)
+
+
+def test_fall_back_common_expressions_stay_after_base():
+    base = _utc(2024, 11, 3, 6, 3)
+    assert get_next_run_time("* * * * *", base, NEW_YORK) == _utc(2024, 11, 3, 6, 4)
+    assert get_next_run_time("*/5 * * * *", base, NEW_YORK) == _utc(2024, 11, 3, 6, 5)
+    assert get_next_run_time("0 * * * *", base, NEW_YORK) == _utc(2024, 11, 3, 7, 0)
+
+
+def test_fall_back_hourly_fires_at_start_of_repeated_hour():
+    # 05:03Z is 01:03 EDT; the next full hour is 01:00 EST
+    base = _utc(2024, 11, 3, 5, 3)
+    assert get_next_run_time("0 * * * *", base, NEW_YORK) == _utc(2024, 11, 3, 6, 0)
@@ -3,6 +3,7 @@ import { toast } from "sonner";
 
 import {
   NotificationRecord,
+  NotificationStatus,
   NotificationUpdate,
   UseNotificationWebSocketOptions,
 } from "@/types/features/notificationTypes";
@@ -12,11 +13,14 @@ interface WebSocketMessage {
     | "notification.delivered"
     | "notification.updated"
     | "notification.read"
+    | "notification.bulk_updated"
     | "notification.reactivated"
     | "ping"
     | "error";
   notification?: NotificationRecord;
   notification_id?: string;
+  notification_ids?: string[];
+  status?: NotificationStatus;
   updates?: NotificationUpdate;
   message?: string;
 }
@@ -96,6 +100,19 @@ export function useNotificationWebSocket(
               }
               break;
 
+            case "notification.bulk_updated":
+              if (
+                message.notification_ids &&
+                (message.updates || message.status) &&
+                options.onBulkUpdate
+              ) {
+                options.onBulkUpdate(
+                  message.notification_ids,
+                  message.updates ?? { status: message.status },
+                );
+              }
+              break;
+
             case "ping":
               // Respond to ping to keep connection alive
               ws.send(JSON.stringify({ type: "pong" }));
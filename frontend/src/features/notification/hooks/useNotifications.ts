@@ -5,6 +5,7 @@ import { NotificationsAPI } from "@/services/api/notifications";
 import {
   NotificationRecord,
   NotificationStatus,
+  NotificationUpdate,
   UseNotificationsOptions,
 } from "@/types/features/notificationTypes";
 
@@ -22,6 +23,7 @@ interface UseNotificationsReturn {
   unreadCount: number;
   addNotification: (notification: NotificationRecord) => void;
   updateNotification: (notification: NotificationRecord) => void;
+  applyBulkUpdate: (ids: string[], updates: NotificationUpdate) => void;
 }
 
 export function useNotifications(
@@ -173,6 +175,26 @@ export function useNotifications(
     [],
   );
 
+  const applyBulkUpdate = useCallback(
+    (ids: string[], updates: NotificationUpdate) => {
+      const updatedIds = new Set(ids);
+      const { status, read_at, archived_at } = updates;
+      setNotifications((prev) =>
+        prev.map((notification) =>
+          updatedIds.has(notification.id)
+            ? {
+                ...notification,
+                status: status ?? notification.status,
+                read_at: read_at ?? notification.read_at,
+                archived_at: archived_at ?? notification.archived_at,
+              }
+            : notification,
+        ),
+      );
+    },
+    [],
+  );
+
   // Calculate unread count
   const unreadCount = notifications.filter(
     (notification) => notification.status === NotificationStatus.DELIVERED,
@@ -197,5 +219,6 @@ export function useNotifications(
     unreadCount,
     addNotification,
     updateNotification,
+    applyBulkUpdate,
   };
 }
@@ -13,13 +13,15 @@ import { HeroUIProvider } from "@/layouts/HeroUIProvider";
 import QueryProvider from "@/layouts/QueryProvider";
 
 export default function ProvidersLayout({ children }: { children: ReactNode }) {
-  const { addNotification, updateNotification } = useNotifications({
-    limit: 100,
-  });
+  const { addNotification, updateNotification, applyBulkUpdate } =
+    useNotifications({
+      limit: 100,
+    });
 
   useNotificationWebSocket({
     onNotification: addNotification,
     onUpdate: updateNotification,
+    onBulkUpdate: applyBulkUpdate,
   });
 
   return (
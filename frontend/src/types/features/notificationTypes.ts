@@ -366,6 +366,7 @@ export interface NotificationRecord {
   created_at: string;
   delivered_at?: string;
   read_at?: string;
+  archived_at?: string;
   source: NotificationSource;
   content: NotificationContent;
   metadata?: NotificationMetadata;
@@ -544,5 +545,9 @@ export interface UseNotificationsOptions {
 export interface UseNotificationWebSocketOptions {
   onNotification?: (notification: NotificationRecord) => void;
   onUpdate?: (notification: NotificationRecord) => void;
+  onBulkUpdate?: (
+    notificationIds: string[],
+    updates: NotificationUpdate,
+  ) => void;
   onError?: (error: Error) => void;
 }